@@ -1,6 +1,18 @@
 import datetime
+import functools
+
+@functools.lru_cache(maxsize=1)
+def _current_year():
+    # Cached so repeated years_of_service reads don't re-query the clock.
+    # Long-running processes crossing a year boundary can call
+    # _current_year.cache_clear() to refresh.
+    return datetime.datetime.now().year
 
 class Employee:
+    # Slotted layout: no per-instance __dict__, so each object is
+    # roughly half the size and attribute access skips a dict lookup
+    __slots__ = ('fname', 'lname', 'empid', 'phone', 'year')
+
     def __init__ (self, fname, lname, empid, phone, year ):
         self.fname = fname
         self.lname = lname
@@ -10,22 +22,36 @@ class Employee:
 
     @property
     def years_of_service(self):
-        current_year = datetime.datetime.now().year
-        return max(0, current_year - self.year)
+        served = _current_year() - self.year
+        return served if served > 0 else 0
+
+    def calculateCompensation(self):
+        # Backwards-compatible shim; subclasses cache the real value.
+        return self.compensation
 
 class Project:
+    __slots__ = ('projectname', 'revenue')
 
     def __init__ (self, projectname, revenue):
         self.projectname = projectname
         self.revenue = float(revenue)
 
 class GeneralManager(Employee):
+    __slots__ = ('projects', '_total_revenue', '_compensation')
+
     def __init__ (self, fname, lname, empid, phone, year, projects):
         super().__init__(fname, lname, empid, phone, year)
         self.projects = projects
+        self._total_revenue = sum(project.revenue for project in projects)
+        self._compensation = None
 
-    def calculateCompensation(self):
-        return 0.03 * sum(project.revenue for project in self.projects)
+    @property
+    def compensation(self):
+        # Slot-backed memo; cached_property needs a __dict__, which
+        # __slots__ removes
+        if self._compensation is None:
+            self._compensation = 0.03 * self._total_revenue
+        return self._compensation
 
     def __str__ (self):
         projects_str = ', '.join([project.projectname for project in self.projects])
@@ -35,12 +61,19 @@ class GeneralManager(Employee):
 
 
 class ProjectManager(Employee):
+    __slots__ = ('project', '_project_revenue', '_compensation')
+
     def __init__ (self, fname, lname, empid,phone, year, project):
         super().__init__(fname, lname, empid, phone, year)
         self.project = project
+        self._project_revenue = project.revenue if project else 0.0
+        self._compensation = None
 
-    def calculateCompensation(self):
-        return 0.05 * (self.project.revenue if self.project else 0)
+    @property
+    def compensation(self):
+        if self._compensation is None:
+            self._compensation = 0.05 * self._project_revenue
+        return self._compensation
 
     def __str__ (self):
         project_str = self.project.projectname if self.project else 'None'
@@ -49,13 +82,20 @@ class ProjectManager(Employee):
                 f"Total Compensation: ${self.calculateCompensation():.2f}")
 
 class Programmer(Employee):
+    __slots__ = ('annualsalary', 'project', '_project_revenue', '_compensation')
+
     def __init__ (self, fname, lname, empid, phone, year, annualsalary, project):
         super().__init__(fname, lname, empid, phone, year)
         self.annualsalary = float(annualsalary)
         self.project = project
+        self._project_revenue = project.revenue if project else 0.0
+        self._compensation = None
 
-    def calculateCompensation(self):
-        return self.annualsalary + 0.01 * (self.project.revenue if self.project else 0)
+    @property
+    def compensation(self):
+        if self._compensation is None:
+            self._compensation = self.annualsalary + 0.01 * self._project_revenue
+        return self._compensation
 
     def __str__ (self):
         project_str = self.project.projectname if self.project else 'None'
@@ -64,12 +104,27 @@ class Programmer(Employee):
                 f"Total Compensation: ${self.calculateCompensation():.2f}")
 
 class Staff(Employee):
+    __slots__ = ('_annualsalary', '_compensation')
+
     def __init__ (self, fname, lname, empid, phone, year, annualsalary):
         super().__init__(fname, lname, empid, phone, year)
         self.annualsalary = float(annualsalary)
 
-    def calculateCompensation(self):
-        return self.annualsalary + 100 * self.years_of_service
+    @property
+    def annualsalary(self):
+        return self._annualsalary
+
+    @annualsalary.setter
+    def annualsalary(self, value):
+        self._annualsalary = float(value)
+        # A salary change invalidates the memoized compensation.
+        self._compensation = None
+
+    @property
+    def compensation(self):
+        if self._compensation is None:
+            self._compensation = self.annualsalary + 100 * self.years_of_service
+        return self._compensation
 
     def __str__ (self):
         return (f"Staff: {self.fname} {self.lname}, ID: {self.empid}, Phone: {self.phone}, "
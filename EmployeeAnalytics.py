@@ -4,47 +4,139 @@ Employee Management System - Analytics Module
 Handles salary analytics and reporting
 """
 
+import heapq
+import itertools
 import logging
+import statistics
+import time
+from collections import defaultdict, deque
+from operator import attrgetter
 from typing import List, Dict, Any, Optional
-from employee import Employee, Manager
+from employee import Employee
 from datetime import datetime
 
+# C-implemented salary key for sort/heap operations
+_SALARY_KEY = attrgetter('salary')
+
+# Upper bound on retained salary-change records
+MAX_SALARY_HISTORY = 10_000
+
 # Configure logging for analytics
 analytics_logger = logging.getLogger('analytics')
 analytics_logger.setLevel(logging.INFO)
 
+class _EmployeeColumns:
+    """Columnar (structure-of-arrays) view of an employee list.
+
+    Holds parallel salary/department/is-manager columns so analytics can
+    reduce over flat lists instead of re-walking Employee objects.
+    """
+
+    __slots__ = ('salaries', 'departments', 'is_manager')
+
+    def __init__(self, employees: List[Employee]):
+        salaries = []
+        departments = []
+        is_manager = []
+        for emp in employees:
+            salaries.append(emp.salary)
+            departments.append(emp.department)
+            is_manager.append(emp._is_manager)
+        self.salaries = salaries
+        self.departments = departments
+        self.is_manager = is_manager
+
+
 class EmployeeAnalytics:
     """Analytics class for employee salary tracking and reporting"""
-    
+
     def __init__(self):
         """Initialize analytics tracking"""
-        self.salary_history = []  # Track salary changes over time
+        # Track salary changes over time; bounded so long-running
+        # sessions cannot grow the history without limit
+        self.salary_history = deque(maxlen=MAX_SALARY_HISTORY)
+        # Compact change tuples awaiting materialization into full records
+        self._pending = []
         self.analytics_logger = analytics_logger
-    
+        self._columns = None
+        self._columns_src = None
+        self._dept_index = None
+        self._type_partition = None
+
+    def _build_columns(self, employees: List[Employee]) -> _EmployeeColumns:
+        """Build (or reuse) the columnar view for this employee list
+
+        The source list is held as a strong reference and compared by
+        identity: the reference pins the id against reuse after garbage
+        collection, and a rebound list is detected immediately. In-place
+        mutation of the same list still needs invalidate_columns().
+        """
+        if self._columns_src is not employees or len(employees) != len(self._columns.salaries):
+            self._columns = _EmployeeColumns(employees)
+            self._columns_src = employees
+            self._dept_index = None
+            self._type_partition = None
+        return self._columns
+
+    def invalidate_columns(self):
+        """Drop the cached columnar view (call after employees change)"""
+        self._columns = None
+        self._columns_src = None
+        self._dept_index = None
+        self._type_partition = None
+
+    def _aggregate_columns(self, employees: List[Employee]):
+        """Build the per-department index and the regular/manager salary
+        partition in one fused pass over the cached columns.
+
+        Both results are cached alongside the columns, so a full salary
+        report pays for a single sweep no matter how many sections
+        consume them.
+        """
+        cols = self._build_columns(employees)
+        if self._dept_index is None or self._type_partition is None:
+            dept_index = defaultdict(list)
+            regulars = []
+            managers = []
+            # Bind the append methods once so the loop skips repeated lookups
+            append_regular = regulars.append
+            append_manager = managers.append
+            for dept, salary, is_mgr in zip(cols.departments, cols.salaries,
+                                            cols.is_manager):
+                dept_index[dept].append(salary)
+                (append_manager if is_mgr else append_regular)(salary)
+            self._dept_index = dept_index
+            self._type_partition = (regulars, managers)
+        return self._dept_index, self._type_partition
+
+    def _dept_salary_index(self, employees: List[Employee]) -> Dict[str, List[float]]:
+        """Lazily build a department -> salaries index over the cached columns"""
+        return self._aggregate_columns(employees)[0]
+
     def calculate_average_salary(self, employees: List[Employee]) -> float:
         """Calculate average salary across all employees"""
         if not employees:
             return 0.0
-        
-        total_salary = sum(emp.salary for emp in employees)
-        average = total_salary / len(employees)
-        
-        self.analytics_logger.info(f"Calculated average salary: ${average:,.2f} for {len(employees)} employees")
+
+        salaries = self._build_columns(employees).salaries
+        average = sum(salaries) / len(salaries)
+
+        self.analytics_logger.info("Calculated average salary: $%.2f for %d employees", average, len(employees))
         return average
-    
+
     def calculate_department_average_salary(self, employees: List[Employee], department: str) -> float:
         """Calculate average salary for a specific department"""
-        dept_employees = [emp for emp in employees if emp.department == department.upper()]
-        
-        if not dept_employees:
+        department = department.upper()
+        dept_salaries = self._dept_salary_index(employees).get(department)
+
+        if not dept_salaries:
             return 0.0
-        
-        total_salary = sum(emp.salary for emp in dept_employees)
-        average = total_salary / len(dept_employees)
-        
-        self.analytics_logger.info(f"Calculated average salary for {department}: ${average:,.2f} for {len(dept_employees)} employees")
+
+        average = sum(dept_salaries) / len(dept_salaries)
+
+        self.analytics_logger.info("Calculated average salary for %s: $%.2f for %d employees", department, average, len(dept_salaries))
         return average
-    
+
     def calculate_salary_statistics(self, employees: List[Employee]) -> Dict[str, Any]:
         """Calculate comprehensive salary statistics"""
         if not employees:
@@ -56,177 +148,221 @@ class EmployeeAnalytics:
                 'total': 0.0,
                 'median': 0.0
             }
-        
-        salaries = [emp.salary for emp in employees]
-        salaries.sort()
-        
-        stats = {
-            'count': len(employees),
-            'average': sum(salaries) / len(salaries),
+
+        stats = self._stats_from_salaries(self._build_columns(employees).salaries)
+
+        self.analytics_logger.info("Calculated salary statistics: %s", stats)
+        return stats
+
+    @staticmethod
+    def _stats_from_salaries(salaries: List[float]) -> Dict[str, Any]:
+        """Compute the standard statistics bundle from a raw salary list"""
+        if not salaries:
+            return {
+                'count': 0,
+                'average': 0.0,
+                'min': 0.0,
+                'max': 0.0,
+                'total': 0.0,
+                'median': 0.0
+            }
+
+        # Each reducer is a single C-level pass; no sorted copy of the
+        # whole column is materialized for min/max/total
+        count = len(salaries)
+        total = sum(salaries)
+
+        return {
+            'count': count,
+            'average': total / count,
             'min': min(salaries),
             'max': max(salaries),
-            'total': sum(salaries),
-            'median': salaries[len(salaries) // 2] if salaries else 0.0
+            'total': total,
+            'median': statistics.median_high(salaries)
         }
-        
-        self.analytics_logger.info(f"Calculated salary statistics: {stats}")
-        return stats
     
     def track_salary_change(self, employee: Employee, old_salary: float, new_salary: float, operation: str):
-        """Track salary changes for analytics"""
-        change_record = {
-            'timestamp': datetime.now().isoformat(),
-            'employee_id': employee.id,
-            'employee_name': f"{employee.fname} {employee.lname}",
-            'department': employee.department,
-            'old_salary': old_salary,
-            'new_salary': new_salary,
-            'change_amount': new_salary - old_salary,
-            'change_percentage': ((new_salary - old_salary) / old_salary * 100) if old_salary > 0 else 0,
-            'operation': operation
-        }
-        
-        self.salary_history.append(change_record)
-        self.analytics_logger.info(f"Tracked salary change: {change_record}")
-    
+        """Track salary changes for analytics.
+
+        The mutation path only appends a compact tuple; full change
+        records (name string, deltas, percentages) are materialized in
+        one batch the first time the history is read.
+        """
+        self._pending.append((time.time_ns(), employee.id,
+                              employee.fname, employee.lname,
+                              employee.department,
+                              old_salary, new_salary, operation))
+        self.analytics_logger.info("Tracked salary change: %s %s",
+                                   operation, employee.id)
+
+    def _flush_pending(self):
+        """Materialize buffered change tuples into full history records"""
+        if not self._pending:
+            return
+        append = self.salary_history.append
+        for (ts_ns, emp_id, fname, lname, department,
+             old_salary, new_salary, operation) in self._pending:
+            append({
+                # Raw epoch timestamp; the ISO string is only built when
+                # the history is actually read (see _with_timestamp)
+                'timestamp_ns': ts_ns,
+                'employee_id': emp_id,
+                'employee_name': f"{fname} {lname}",
+                'department': department,
+                'old_salary': old_salary,
+                'new_salary': new_salary,
+                'change_amount': new_salary - old_salary,
+                'change_percentage': ((new_salary - old_salary) / old_salary * 100) if old_salary > 0 else 0,
+                'operation': operation
+            })
+        self._pending.clear()
+
+
+    @staticmethod
+    def _with_timestamp(record: Dict[str, Any]) -> Dict[str, Any]:
+        """Return a copy of a change record with a formatted timestamp"""
+        record = dict(record)
+        record['timestamp'] = datetime.fromtimestamp(
+            record.pop('timestamp_ns') / 1_000_000_000).isoformat()
+        return record
+
     def get_salary_history(self) -> List[Dict[str, Any]]:
         """Get complete salary change history"""
-        return self.salary_history.copy()
-    
+        self._flush_pending()
+        return [self._with_timestamp(record) for record in self.salary_history]
+
     def get_recent_salary_changes(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent salary changes"""
-        return self.salary_history[-limit:] if self.salary_history else []
+        self._flush_pending()
+        recent = list(itertools.islice(reversed(self.salary_history), limit))
+        recent.reverse()
+        return [self._with_timestamp(record) for record in recent]
     
     def calculate_salary_by_employee_type(self, employees: List[Employee]) -> Dict[str, Dict[str, Any]]:
         """Calculate salary statistics by employee type"""
-        regular_employees = [emp for emp in employees if not isinstance(emp, Manager)]
-        managers = [emp for emp in employees if isinstance(emp, Manager)]
-        
+        regular_salaries, manager_salaries = self._aggregate_columns(employees)[1]
+
         result = {}
-        
-        if regular_employees:
-            result['Regular Employees'] = self.calculate_salary_statistics(regular_employees)
-        
-        if managers:
-            result['Managers'] = self.calculate_salary_statistics(managers)
-        
+
+        if regular_salaries:
+            result['Regular Employees'] = self._stats_from_salaries(regular_salaries)
+
+        if manager_salaries:
+            result['Managers'] = self._stats_from_salaries(manager_salaries)
+
         return result
-    
+
     def calculate_salary_by_department(self, employees: List[Employee]) -> Dict[str, Dict[str, Any]]:
         """Calculate salary statistics by department"""
-        departments = {}
-        
-        for emp in employees:
-            dept = emp.department
-            if dept not in departments:
-                departments[dept] = []
-            departments[dept].append(emp)
-        
-        result = {}
-        for dept, dept_employees in departments.items():
-            result[dept] = self.calculate_salary_statistics(dept_employees)
-        
-        return result
+        return {dept: self._stats_from_salaries(salaries)
+                for dept, salaries in self._dept_salary_index(employees).items()}
     
     def find_highest_paid_employees(self, employees: List[Employee], limit: int = 5) -> List[Employee]:
         """Find highest paid employees"""
-        sorted_employees = sorted(employees, key=lambda emp: emp.salary, reverse=True)
-        return sorted_employees[:limit]
-    
+        return heapq.nlargest(limit, employees, key=_SALARY_KEY)
+
     def find_lowest_paid_employees(self, employees: List[Employee], limit: int = 5) -> List[Employee]:
         """Find lowest paid employees"""
-        sorted_employees = sorted(employees, key=lambda emp: emp.salary)
-        return sorted_employees[:limit]
+        return heapq.nsmallest(limit, employees, key=_SALARY_KEY)
     
     def calculate_salary_gap_analysis(self, employees: List[Employee]) -> Dict[str, Any]:
         """Calculate salary gap analysis between managers and regular employees"""
-        regular_employees = [emp for emp in employees if not isinstance(emp, Manager)]
-        managers = [emp for emp in employees if isinstance(emp, Manager)]
-        
-        if not regular_employees or not managers:
+        regular_salaries, manager_salaries = self._aggregate_columns(employees)[1]
+
+        if not regular_salaries or not manager_salaries:
             return {'error': 'Need both regular employees and managers for gap analysis'}
-        
-        regular_avg = sum(emp.salary for emp in regular_employees) / len(regular_employees)
-        manager_avg = sum(emp.salary for emp in managers) / len(managers)
-        
+
+        regular_avg = sum(regular_salaries) / len(regular_salaries)
+        manager_avg = sum(manager_salaries) / len(manager_salaries)
+
         gap_analysis = {
             'regular_employee_average': regular_avg,
             'manager_average': manager_avg,
             'absolute_gap': manager_avg - regular_avg,
             'percentage_gap': ((manager_avg - regular_avg) / regular_avg * 100) if regular_avg > 0 else 0,
-            'regular_count': len(regular_employees),
-            'manager_count': len(managers)
+            'regular_count': len(regular_salaries),
+            'manager_count': len(manager_salaries)
         }
         
-        self.analytics_logger.info(f"Calculated salary gap analysis: {gap_analysis}")
+        self.analytics_logger.info("Calculated salary gap analysis: %s", gap_analysis)
         return gap_analysis
     
     def generate_salary_report(self, employees: List[Employee]) -> str:
         """Generate a comprehensive salary report"""
-        report = []
-        report.append("=" * 60)
-        report.append("EMPLOYEE SALARY ANALYTICS REPORT")
-        report.append("=" * 60)
-        report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append("")
-        
+        divider = "=" * 60
+        report = [
+            divider,
+            "EMPLOYEE SALARY ANALYTICS REPORT",
+            divider,
+            f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            ""
+        ]
+
         # Overall statistics
         overall_stats = self.calculate_salary_statistics(employees)
-        report.append("OVERALL SALARY STATISTICS:")
-        report.append(f"  Total Employees: {overall_stats['count']}")
-        report.append(f"  Average Salary: ${overall_stats['average']:,.2f}")
-        report.append(f"  Minimum Salary: ${overall_stats['min']:,.2f}")
-        report.append(f"  Maximum Salary: ${overall_stats['max']:,.2f}")
-        report.append(f"  Median Salary: ${overall_stats['median']:,.2f}")
-        report.append(f"  Total Payroll: ${overall_stats['total']:,.2f}")
-        report.append("")
-        
+        report.extend([
+            "OVERALL SALARY STATISTICS:",
+            f"  Total Employees: {overall_stats['count']}",
+            f"  Average Salary: ${overall_stats['average']:,.2f}",
+            f"  Minimum Salary: ${overall_stats['min']:,.2f}",
+            f"  Maximum Salary: ${overall_stats['max']:,.2f}",
+            f"  Median Salary: ${overall_stats['median']:,.2f}",
+            f"  Total Payroll: ${overall_stats['total']:,.2f}",
+            ""
+        ])
+
         # Department breakdown
         dept_stats = self.calculate_salary_by_department(employees)
         report.append("SALARY BY DEPARTMENT:")
         for dept, stats in dept_stats.items():
-            report.append(f"  {dept}:")
-            report.append(f"    Count: {stats['count']}")
-            report.append(f"    Average: ${stats['average']:,.2f}")
-            report.append(f"    Range: ${stats['min']:,.2f} - ${stats['max']:,.2f}")
+            report.extend([
+                f"  {dept}:",
+                f"    Count: {stats['count']}",
+                f"    Average: ${stats['average']:,.2f}",
+                f"    Range: ${stats['min']:,.2f} - ${stats['max']:,.2f}"
+            ])
         report.append("")
-        
+
         # Employee type breakdown
         type_stats = self.calculate_salary_by_employee_type(employees)
         report.append("SALARY BY EMPLOYEE TYPE:")
         for emp_type, stats in type_stats.items():
-            report.append(f"  {emp_type}:")
-            report.append(f"    Count: {stats['count']}")
-            report.append(f"    Average: ${stats['average']:,.2f}")
-            report.append(f"    Range: ${stats['min']:,.2f} - ${stats['max']:,.2f}")
+            report.extend([
+                f"  {emp_type}:",
+                f"    Count: {stats['count']}",
+                f"    Average: ${stats['average']:,.2f}",
+                f"    Range: ${stats['min']:,.2f} - ${stats['max']:,.2f}"
+            ])
         report.append("")
-        
+
         # Gap analysis
         gap_analysis = self.calculate_salary_gap_analysis(employees)
         if 'error' not in gap_analysis:
-            report.append("SALARY GAP ANALYSIS:")
-            report.append(f"  Regular Employee Average: ${gap_analysis['regular_employee_average']:,.2f}")
-            report.append(f"  Manager Average: ${gap_analysis['manager_average']:,.2f}")
-            report.append(f"  Absolute Gap: ${gap_analysis['absolute_gap']:,.2f}")
-            report.append(f"  Percentage Gap: {gap_analysis['percentage_gap']:.1f}%")
-            report.append("")
-        
+            report.extend([
+                "SALARY GAP ANALYSIS:",
+                f"  Regular Employee Average: ${gap_analysis['regular_employee_average']:,.2f}",
+                f"  Manager Average: ${gap_analysis['manager_average']:,.2f}",
+                f"  Absolute Gap: ${gap_analysis['absolute_gap']:,.2f}",
+                f"  Percentage Gap: {gap_analysis['percentage_gap']:.1f}%",
+                ""
+            ])
+
         # Top earners
         top_earners = self.find_highest_paid_employees(employees, 5)
         report.append("TOP 5 EARNERS:")
-        for i, emp in enumerate(top_earners, 1):
-            report.append(f"  {i}. {emp.fname} {emp.lname} ({emp.department}) - ${emp.salary:,.2f}")
+        report.extend(f"  {i}. {emp.fname} {emp.lname} ({emp.department}) - ${emp.salary:,.2f}"
+                      for i, emp in enumerate(top_earners, 1))
         report.append("")
-        
+
         # Recent changes
         recent_changes = self.get_recent_salary_changes(5)
         if recent_changes:
             report.append("RECENT SALARY CHANGES:")
-            for change in recent_changes:
-                report.append(f"  {change['employee_name']}: ${change['old_salary']:,.2f} → ${change['new_salary']:,.2f} ({change['operation']})")
-        
-        report.append("=" * 60)
-        
+            report.extend(f"  {change['employee_name']}: ${change['old_salary']:,.2f} → ${change['new_salary']:,.2f} ({change['operation']})"
+                          for change in recent_changes)
+
+        report.append(divider)
+
         return "\n".join(report)
 
 
@@ -5,56 +5,243 @@ Main application controller coordinating Model, View, and Data layers
 """
 
 import logging
-import sqlite3
-from datetime import datetime
-from typing import List, Dict, Any, Optional
+import threading
+import time
+from collections import deque
+from datetime import date, datetime
+from typing import List, Dict, Any, NamedTuple, Optional
 from employee import Employee, Manager
 from EmployeeData import EmployeeData
 from EmployeeView import EmployeeView
 from EmployeeAnalytics import EmployeeAnalytics
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('employee_app.log'),
-        logging.StreamHandler()
-    ]
-)
+def _configure_logging():
+    """Set up app logging; deferred so importing the module has no side effects.
+
+    Records are funneled through a queue to a background listener that
+    owns the file/stream handlers, so logging calls on the hot path cost
+    a queue put instead of a synchronous disk write.
+    """
+    import atexit
+    import queue
+    from logging.handlers import QueueHandler, QueueListener
+
+    root = logging.getLogger()
+    if root.handlers:
+        return
+
+    log_queue = queue.Queue(-1)
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler('employee_app.log')
+    stream_handler = logging.StreamHandler()
+    file_handler.setFormatter(formatter)
+    stream_handler.setFormatter(formatter)
+
+    listener = QueueListener(log_queue, file_handler, stream_handler,
+                             respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+
+# Constructors keyed by employee type; shared by create_employee so the
+# per-creation branch and duplicated keyword plumbing go away
+_EMP_FACTORIES = {
+    'Manager': lambda d: Manager(
+        emp_id=d['id'],
+        fname=d['fname'],
+        lname=d['lname'],
+        department=d['department'],
+        ph_number=d['ph_number'],
+        salary=d['salary'],
+        team_size=d.get('team_size', 0),
+        office_number=d.get('office_number', '')
+    ),
+    'Employee': lambda d: Employee(
+        emp_id=d['id'],
+        fname=d['fname'],
+        lname=d['lname'],
+        department=d['department'],
+        ph_number=d['ph_number'],
+        salary=d['salary']
+    ),
+}
+
+
+class _SqlOp(NamedTuple):
+    """One logged SQL operation; slimmer than a per-entry dict"""
+    timestamp: str
+    operation: str
+    sql: str
+    params: tuple
+    result: str
+
 
 class EmployeeApp:
     """Main application controller"""
-    
+
+    # Flush the buffered SQL-operation log after this many entries
+    SQL_FLUSH_THRESHOLD = 200
+
+    # Shared parameterized statement templates; one constant per mutation
+    # so every logged operation reuses the same string object
+    INSERT_SQL = ("INSERT INTO employees (id, name, department, salary, "
+                  "hire_date) VALUES (?, ?, ?, ?, ?)")
+    UPDATE_SQL = ("UPDATE employees SET name = ?, department = ?, "
+                  "salary = ? WHERE id = ?")
+    DELETE_SQL = "DELETE FROM employees WHERE id = ?"
+
+    # Most recent SQL-operation entries kept in memory for display;
+    # the full history lives in the sql_ops table
+    MAX_SQL_OPERATIONS = 500
+
     def __init__(self):
         """Initialize the application"""
+        _configure_logging()
         self.view = EmployeeView()
         self.data_layer = EmployeeData()
         self.analytics = EmployeeAnalytics()
-        self.sql_operations = []  # Store SQL operations for display
+        # Bounded: old entries age out in O(1) instead of growing forever
+        self.sql_operations = deque(maxlen=self.MAX_SQL_OPERATIONS)
+        self._sql_buffer = []  # Pending entries awaiting a batched DB flush
+        self._last_sec = 0  # Second for which _last_ts was formatted
+        self._last_ts = ''
         self.logger = logging.getLogger(__name__)
-        
+
+        # In-memory employee cache; reloaded from the data layer only
+        # after a create/edit/delete bumps the version counter
+        self._emp_cache = None
+        self._emp_table = None
+        self._emp_version = 0
+        self._emp_cache_version = -1
+
+        # Handle of the most recent background backup, if any
+        self._backup_thread = None
+
         # Initialize SQLite connection for SQL logging
         self.db_connection = None
         self.init_sqlite_connection()
+
+        # Redraw the main menu only after something has drawn over it
+        self._screen_dirty = True
+
+        # O(1) menu dispatch instead of an if/elif ladder per keystroke
+        self._dispatch = {
+            '1': self.create_employee,
+            '2': self.edit_employee,
+            '3': self.delete_employee,
+            '4': self.display_all_employees,
+            '5': self.search_employees,
+            '6': self.display_department_summary,
+            '7': self.salary_analytics,
+            '8': self.backup_data,
+            '9': self.view_sql_operations,
+        }
+
+    def _employees(self) -> List[Employee]:
+        """Return the employee list, reloading only when stale"""
+        if self._emp_cache_version != self._emp_version:
+            self._emp_cache = self.data_layer.load_employees()
+            self._emp_table = None
+            self._emp_cache_version = self._emp_version
+        return self._emp_cache
+
+    def _table(self):
+        """Columnar snapshot of the cached employee list, built lazily"""
+        employees = self._employees()
+        if self._emp_table is None:
+            self._emp_table = self.data_layer.load_table(employees)
+        return self._emp_table
+
+    def _invalidate_employees(self):
+        """Bump the employee-list version after a mutation"""
+        self._emp_version += 1
+        self._emp_table = None
+        self.analytics.invalidate_columns()
     
     def init_sqlite_connection(self):
         """Initialize SQLite connection for SQL operations logging"""
+        # Imported here so model-only imports of this module skip the
+        # sqlite3 extension load
+        import sqlite3
+
         try:
             self.db_connection = sqlite3.connect('employees.db')
+            # WAL groups commits so batched log flushes don't fsync per row;
+            # temp_store/cache_size/mmap keep sort spills and page reads in
+            # memory (cache_size is negative KiB: 64 MiB cap)
+            self.db_connection.executescript(
+                "PRAGMA journal_mode=WAL;"
+                "PRAGMA synchronous=NORMAL;"
+                "PRAGMA temp_store=MEMORY;"
+                "PRAGMA cache_size=-65536;"
+                "PRAGMA mmap_size=268435456;"
+            )
+            self.db_connection.execute(
+                "CREATE TABLE IF NOT EXISTS sql_ops ("
+                "ts TEXT, operation TEXT, sql TEXT, result TEXT)"
+            )
+            # Keyed on id so ORDER BY id streams from the index with no
+            # filesort, should the logged statements ever be replayed
+            self.db_connection.execute(
+                "CREATE TABLE IF NOT EXISTS employees ("
+                "id TEXT PRIMARY KEY, name TEXT, department TEXT, "
+                "salary REAL, hire_date TEXT, is_manager INTEGER, "
+                "team_size INTEGER, office_number TEXT)"
+            )
             self.logger.info("SQLite connection established for SQL logging")
         except Exception as e:
-            self.logger.error(f"Failed to connect to SQLite: {e}")
-    
-    def log_sql_operation(self, operation: str, sql: str, result: str = ""):
-        """Log SQL operations for display"""
-        self.sql_operations.append({
-            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            'operation': operation,
-            'sql': sql,
-            'result': result
-        })
-        self.logger.info(f"SQL Operation: {operation} - {sql}")
+            self.logger.error("Failed to connect to SQLite: %s", e)
+
+    def log_sql_operation(self, operation: str, sql_template: str,
+                          params: tuple = (), result: str = ""):
+        """Log SQL operations for display.
+
+        The template and parameters are stored as-is; the full statement
+        is only rendered when the log is viewed or flushed, keeping the
+        hot create/edit/delete path free of string formatting.
+        """
+        # The timestamp has second resolution, so only re-format when the
+        # clock has ticked over since the previous entry; isoformat skips
+        # strftime's format-string parsing
+        now = int(time.time())
+        if now != self._last_sec:
+            self._last_ts = datetime.fromtimestamp(now).isoformat(sep=' ')
+            self._last_sec = now
+
+        entry = _SqlOp(self._last_ts, operation, sql_template, params, result)
+        self.sql_operations.append(entry)
+        self._sql_buffer.append(entry)
+        if len(self._sql_buffer) >= self.SQL_FLUSH_THRESHOLD:
+            self.flush_sql_log()
+        self.logger.info("SQL Operation: %s - %s", operation, sql_template)
+
+    @staticmethod
+    def _render_sql(template: str, params: tuple = ()) -> str:
+        """Substitute ? placeholders with quoted values for display"""
+        if not params:
+            return template
+        quoted = tuple(f"'{p}'" if isinstance(p, str) else str(p) for p in params)
+        return template.replace('?', '{}').format(*quoted)
+
+    def flush_sql_log(self):
+        """Persist buffered SQL-operation entries in one transaction"""
+        if not self._sql_buffer or not self.db_connection:
+            return
+        try:
+            with self.db_connection:
+                self.db_connection.executemany(
+                    "INSERT INTO sql_ops(ts, operation, sql, result) "
+                    "VALUES (?, ?, ?, ?)",
+                    [(op.timestamp, op.operation,
+                      self._render_sql(op.sql, op.params), op.result)
+                     for op in self._sql_buffer]
+                )
+            self._sql_buffer.clear()
+        except Exception as e:
+            self.logger.error("Failed to flush SQL log: %s", e)
     
     def run(self):
         """Main application loop"""
@@ -62,39 +249,32 @@ class EmployeeApp:
         
         while True:
             try:
-                self.view.clear_screen()
-                self.view.display_header()
-                self.view.display_menu()
-                
+                # Invalid input leaves the menu on screen; skip the redraw
+                if self._screen_dirty:
+                    self.view.clear_screen()
+                    self.view.display_header()
+                    self.view.display_menu()
+                    self._screen_dirty = False
+
                 choice = self.view.get_menu_choice()
-                
-                if choice == '1':
-                    self.create_employee()
-                elif choice == '2':
-                    self.edit_employee()
-                elif choice == '3':
-                    self.delete_employee()
-                elif choice == '4':
-                    self.display_all_employees()
-                elif choice == '5':
-                    self.search_employees()
-                elif choice == '6':
-                    self.display_department_summary()
-                elif choice == '7':
-                    self.salary_analytics()
-                elif choice == '8':
-                    self.backup_data()
-                elif choice == '9':
-                    self.view_sql_operations()
+
+                handler = self._dispatch.get(choice)
+                if handler:
+                    handler()
+                    self._screen_dirty = True
                 elif choice == '10':
+                    self._join_backup()
+                    self.flush_sql_log()
                     self.view.display_goodbye_message()
                     break
                 
             except KeyboardInterrupt:
+                self._join_backup()
+                self.flush_sql_log()
                 self.view.display_goodbye_message()
                 break
             except Exception as e:
-                self.logger.error(f"Unexpected error: {e}")
+                self.logger.error("Unexpected error: %s", e)
                 self.view.display_error(f"An unexpected error occurred: {e}")
     
     def create_employee(self):
@@ -116,48 +296,35 @@ class EmployeeApp:
                 return
             
             # Create employee object
-            if emp_type == "Manager":
-                employee = Manager(
-                    emp_id=emp_data['id'],
-                    fname=emp_data['fname'],
-                    lname=emp_data['lname'],
-                    department=emp_data['department'],
-                    ph_number=emp_data['ph_number'],
-                    salary=emp_data['salary'],
-                    team_size=emp_data.get('team_size', 0),
-                    office_number=emp_data.get('office_number', '')
-                )
-            else:
-                employee = Employee(
-                    emp_id=emp_data['id'],
-                    fname=emp_data['fname'],
-                    lname=emp_data['lname'],
-                    department=emp_data['department'],
-                    ph_number=emp_data['ph_number'],
-                    salary=emp_data['salary']
-                )
-            
+            factory = _EMP_FACTORIES.get(emp_type, _EMP_FACTORIES['Employee'])
+            employee = factory(emp_data)
+
             # Save to data layer
             if self.data_layer.add_employee(employee):
+                self._invalidate_employees()
+
                 # Track salary change for analytics
                 self.analytics.track_salary_change(employee, 0, employee.salary, "CREATE")
                 
                 self.log_sql_operation(
                     "INSERT",
-                    f"INSERT INTO employees (id, name, department, salary, hire_date) VALUES ('{employee.id}', '{employee.fname} {employee.lname}', '{employee.department}', {employee.salary}, '{datetime.now().strftime('%Y-%m-%d')}')",
+                    self.INSERT_SQL,
+                    (employee.id, f"{employee.fname} {employee.lname}",
+                     employee.department, employee.salary,
+                     date.today().isoformat()),
                     f"Created {emp_type}: {employee.id}"
                 )
                 self.view.display_success(f"Employee {employee.id} created successfully!")
-                self.logger.info(f"Created employee: {employee.id}")
+                self.logger.info("Created employee: %s", employee.id)
             else:
                 self.view.display_error("Failed to create employee. ID may already exist.")
             
         except ValueError as e:
             self.view.display_error(f"Validation error: {e}")
-            self.logger.error(f"Validation error in create_employee: {e}")
+            self.logger.error("Validation error in create_employee: %s", e)
         except Exception as e:
             self.view.display_error(f"Error creating employee: {e}")
-            self.logger.error(f"Error in create_employee: {e}")
+            self.logger.error("Error in create_employee: %s", e)
         finally:
             self.view.pause()
     
@@ -187,22 +354,14 @@ class EmployeeApp:
             if not self.view.confirm_action("Do you want to edit this employee?"):
                 return
             
-            # Get updated data
-            print(f"\nEnter new information (press Enter to keep current value):")
-            print(f"Current First Name: {employee.fname}")
-            new_fname = input("New First Name: ").strip() or employee.fname
-            
-            print(f"Current Last Name: {employee.lname}")
-            new_lname = input("New Last Name: ").strip() or employee.lname
-            
-            print(f"Current Department: {employee.department}")
-            new_dept = input("New Department: ").strip().upper() or employee.department
-            
-            print(f"Current Phone: {employee.get_formatted_phone()}")
-            new_phone = input("New Phone: ").strip() or employee.ph_number
-            
-            print(f"Current Salary: ${employee.salary:,.2f}")
-            new_salary_input = input("New Salary (press Enter to keep current): ").strip()
+            # Get updated data in one screenful
+            edits = self.view.collect_edits(employee)
+            new_fname = edits['fname'] or employee.fname
+            new_lname = edits['lname'] or employee.lname
+            new_dept = edits['department'] or employee.department
+            new_phone = edits['phone'] or employee.ph_number
+
+            new_salary_input = edits['salary']
             if new_salary_input:
                 try:
                     new_salary = float(new_salary_input)
@@ -229,35 +388,33 @@ class EmployeeApp:
             employee.salary = new_salary
             
             # Update manager-specific fields if applicable
-            if isinstance(employee, Manager):
-                print(f"Current Team Size: {employee.team_size}")
-                new_team_size = input("New Team Size: ").strip()
-                if new_team_size.isdigit():
-                    employee.team_size = int(new_team_size)
-                
-                print(f"Current Office: {employee.office_number}")
-                new_office = input("New Office: ").strip()
-                if new_office:
-                    employee.office_number = new_office
+            if employee.is_manager:
+                if edits['team_size'].isdigit():
+                    employee.team_size = int(edits['team_size'])
+                if edits['office_number']:
+                    employee.office_number = edits['office_number']
             
             # Save changes
             if self.data_layer.update_employee(emp_id, employee):
+                self._invalidate_employees()
                 self.log_sql_operation(
                     "UPDATE",
-                    f"UPDATE employees SET name = '{employee.fname} {employee.lname}', department = '{employee.department}', salary = {employee.salary} WHERE id = '{emp_id}'",
+                    self.UPDATE_SQL,
+                    (f"{employee.fname} {employee.lname}", employee.department,
+                     employee.salary, emp_id),
                     f"Updated employee: {emp_id}"
                 )
                 self.view.display_success(f"Employee {emp_id} updated successfully!")
-                self.logger.info(f"Updated employee: {emp_id}")
+                self.logger.info("Updated employee: %s", emp_id)
             else:
                 self.view.display_error("Failed to update employee.")
             
         except ValueError as e:
             self.view.display_error(f"Validation error: {e}")
-            self.logger.error(f"Validation error in edit_employee: {e}")
+            self.logger.error("Validation error in edit_employee: %s", e)
         except Exception as e:
             self.view.display_error(f"Error editing employee: {e}")
-            self.logger.error(f"Error in edit_employee: {e}")
+            self.logger.error("Error in edit_employee: %s", e)
         finally:
             self.view.pause()
     
@@ -290,19 +447,21 @@ class EmployeeApp:
                 self.analytics.track_salary_change(employee, employee.salary, 0, "DELETE")
                 
                 if self.data_layer.delete_employee(emp_id):
+                    self._invalidate_employees()
                     self.log_sql_operation(
                         "DELETE",
-                        f"DELETE FROM employees WHERE id = '{emp_id}'",
+                        self.DELETE_SQL,
+                        (emp_id,),
                         f"Deleted employee: {emp_id}"
                     )
                     self.view.display_success(f"Employee {emp_id} deleted successfully!")
-                    self.logger.info(f"Deleted employee: {emp_id}")
+                    self.logger.info("Deleted employee: %s", emp_id)
                 else:
                     self.view.display_error("Failed to delete employee.")
             
         except Exception as e:
             self.view.display_error(f"Error deleting employee: {e}")
-            self.logger.error(f"Error in delete_employee: {e}")
+            self.logger.error("Error in delete_employee: %s", e)
         finally:
             self.view.pause()
     
@@ -312,18 +471,22 @@ class EmployeeApp:
             self.view.clear_screen()
             self.view.display_header()
             
-            employees = self.data_layer.load_employees()
-            self.view.display_employees(employees, "ALL EMPLOYEES")
-            
+            # Stream in pages rather than materializing the full list, so
+            # the first rows appear after one batch worth of file I/O
+            total = self.view.display_employee_pages(
+                self.data_layer.iter_employees(), "ALL EMPLOYEES"
+            )
+
             self.log_sql_operation(
                 "SELECT",
-                "SELECT * FROM employees ORDER BY id",
-                f"Retrieved {len(employees)} employees"
+                "SELECT * FROM employees ORDER BY id LIMIT ?",
+                (100,),
+                f"Retrieved {total} employees in pages of 100"
             )
             
         except Exception as e:
             self.view.display_error(f"Error displaying employees: {e}")
-            self.logger.error(f"Error in display_all_employees: {e}")
+            self.logger.error("Error in display_all_employees: %s", e)
         finally:
             self.view.pause()
     
@@ -339,38 +502,21 @@ class EmployeeApp:
             if not criteria:
                 return
             
-            employees = self.data_layer.load_employees()
-            filtered_employees = []
-            
-            for emp in employees:
-                match = True
-                
-                if 'id' in criteria and criteria['id'] not in emp.id:
-                    match = False
-                if 'name' in criteria and criteria['name'].lower() not in emp.fname.lower() and criteria['name'].lower() not in emp.lname.lower():
-                    match = False
-                if 'department' in criteria and emp.department != criteria['department']:
-                    match = False
-                if 'type' in criteria:
-                    if criteria['type'].lower() == 'manager' and not isinstance(emp, Manager):
-                        match = False
-                    elif criteria['type'].lower() == 'employee' and isinstance(emp, Manager):
-                        match = False
-                
-                if match:
-                    filtered_employees.append(emp)
-            
+            filtered_employees = self._table().search(criteria)
+
             self.view.display_employees(filtered_employees, "SEARCH RESULTS")
-            
+
+            where_clause = " AND ".join(f"{field} LIKE ?" for field in criteria)
             self.log_sql_operation(
                 "SELECT",
-                f"SELECT * FROM employees WHERE {list(criteria.keys())[0]} LIKE '%{list(criteria.values())[0]}%'",
+                f"SELECT * FROM employees WHERE {where_clause}",
+                tuple(f"%{value}%" for value in criteria.values()),
                 f"Found {len(filtered_employees)} employees"
             )
             
         except Exception as e:
             self.view.display_error(f"Error searching employees: {e}")
-            self.logger.error(f"Error in search_employees: {e}")
+            self.logger.error("Error in search_employees: %s", e)
         finally:
             self.view.pause()
     
@@ -380,85 +526,69 @@ class EmployeeApp:
             self.view.clear_screen()
             self.view.display_header()
             
-            employees = self.data_layer.load_employees()
-            dept_data = {}
-            
-            for emp in employees:
-                dept = emp.department
-                if dept not in dept_data:
-                    dept_data[dept] = {
-                        'count': 0,
-                        'managers': 0,
-                        'regular': 0,
-                        'total_team_size': 0
-                    }
-                
-                dept_data[dept]['count'] += 1
-                
-                if isinstance(emp, Manager):
-                    dept_data[dept]['managers'] += 1
-                    dept_data[dept]['total_team_size'] += emp.team_size
-                else:
-                    dept_data[dept]['regular'] += 1
-            
-            # Calculate averages
-            for dept in dept_data:
-                if dept_data[dept]['managers'] > 0:
-                    dept_data[dept]['avg_team_size'] = dept_data[dept]['total_team_size'] / dept_data[dept]['managers']
-                else:
-                    dept_data[dept]['avg_team_size'] = 0
-            
+            dept_data = self._table().department_summary()
+
             self.view.display_department_summary(dept_data)
             
             self.log_sql_operation(
                 "SELECT",
                 "SELECT department, COUNT(*) as count, SUM(CASE WHEN employee_type = 'Manager' THEN 1 ELSE 0 END) as managers FROM employees GROUP BY department",
-                f"Department summary for {len(dept_data)} departments"
+                result=f"Department summary for {len(dept_data)} departments"
             )
             
         except Exception as e:
             self.view.display_error(f"Error displaying department summary: {e}")
-            self.logger.error(f"Error in display_department_summary: {e}")
+            self.logger.error("Error in display_department_summary: %s", e)
         finally:
             self.view.pause()
     
     def salary_analytics(self):
         """Handle salary analytics menu"""
         try:
+            # One load for the whole submenu session; mutations can't
+            # happen while we're inside it
+            employees = self._employees()
+
+            # Dict dispatch, mirroring the main menu; every handler but
+            # the history view consumes the session's employee snapshot
+            reports = {
+                '1': self.show_overall_salary_statistics,
+                '2': self.show_department_salary_breakdown,
+                '3': self.show_employee_type_comparison,
+                '4': self.show_top_earners,
+                '5': self.show_lowest_earners,
+                '6': self.show_salary_gap_analysis,
+                '7': self.generate_salary_report,
+            }
+
+            header_drawn = False
             while True:
-                self.view.clear_screen()
-                self.view.display_header()
-                self.view.display_salary_analytics_menu()
-                
+                # Each report draws over the screen; re-header only then
+                if not header_drawn:
+                    self.view.clear_screen()
+                    self.view.display_header()
+                    self.view.display_salary_analytics_menu()
+                    header_drawn = True
+
                 choice = self.view.get_analytics_choice()
-                
-                if choice == '1':
-                    self.show_overall_salary_statistics()
-                elif choice == '2':
-                    self.show_department_salary_breakdown()
-                elif choice == '3':
-                    self.show_employee_type_comparison()
-                elif choice == '4':
-                    self.show_top_earners()
-                elif choice == '5':
-                    self.show_lowest_earners()
-                elif choice == '6':
-                    self.show_salary_gap_analysis()
-                elif choice == '7':
-                    self.generate_salary_report()
+
+                handler = reports.get(choice)
+                if handler:
+                    handler(employees)
+                    header_drawn = False
                 elif choice == '8':
                     self.show_recent_salary_changes()
+                    header_drawn = False
                 elif choice == '9':
                     break
                 
         except Exception as e:
             self.view.display_error(f"Error in salary analytics: {e}")
-            self.logger.error(f"Error in salary_analytics: {e}")
+            self.logger.error("Error in salary_analytics: %s", e)
     
-    def show_overall_salary_statistics(self):
+    def show_overall_salary_statistics(self, employees: List[Employee]):
         """Show overall salary statistics"""
         try:
-            employees = self.data_layer.load_employees()
             stats = self.analytics.calculate_salary_statistics(employees)
             self.view.display_salary_statistics(stats)
         except Exception as e:
@@ -466,10 +596,9 @@ class EmployeeApp:
         finally:
             self.view.pause()
     
-    def show_department_salary_breakdown(self):
+    def show_department_salary_breakdown(self, employees: List[Employee]):
         """Show department salary breakdown"""
         try:
-            employees = self.data_layer.load_employees()
             dept_stats = self.analytics.calculate_salary_by_department(employees)
             self.view.display_department_salary_breakdown(dept_stats)
         except Exception as e:
@@ -477,10 +606,9 @@ class EmployeeApp:
         finally:
             self.view.pause()
     
-    def show_employee_type_comparison(self):
+    def show_employee_type_comparison(self, employees: List[Employee]):
         """Show employee type salary comparison"""
         try:
-            employees = self.data_layer.load_employees()
             type_stats = self.analytics.calculate_salary_by_employee_type(employees)
             self.view.display_employee_type_comparison(type_stats)
         except Exception as e:
@@ -488,10 +616,10 @@ class EmployeeApp:
         finally:
             self.view.pause()
     
-    def show_top_earners(self):
+    def show_top_earners(self, employees: List[Employee]):
         """Show top earners"""
         try:
-            employees = self.data_layer.load_employees()
+            # Analytics uses heapq.nlargest, so passing k keeps this O(N log k)
             top_earners = self.analytics.find_highest_paid_employees(employees, 5)
             self.view.display_top_earners(top_earners, "TOP 5 HIGHEST PAID EMPLOYEES")
         except Exception as e:
@@ -499,10 +627,9 @@ class EmployeeApp:
         finally:
             self.view.pause()
     
-    def show_lowest_earners(self):
+    def show_lowest_earners(self, employees: List[Employee]):
         """Show lowest earners"""
         try:
-            employees = self.data_layer.load_employees()
             lowest_earners = self.analytics.find_lowest_paid_employees(employees, 5)
             self.view.display_top_earners(lowest_earners, "TOP 5 LOWEST PAID EMPLOYEES")
         except Exception as e:
@@ -510,10 +637,9 @@ class EmployeeApp:
         finally:
             self.view.pause()
     
-    def show_salary_gap_analysis(self):
+    def show_salary_gap_analysis(self, employees: List[Employee]):
         """Show salary gap analysis"""
         try:
-            employees = self.data_layer.load_employees()
             gap_analysis = self.analytics.calculate_salary_gap_analysis(employees)
             self.view.display_salary_gap_analysis(gap_analysis)
         except Exception as e:
@@ -521,10 +647,9 @@ class EmployeeApp:
         finally:
             self.view.pause()
     
-    def generate_salary_report(self):
+    def generate_salary_report(self, employees: List[Employee]):
         """Generate complete salary report"""
         try:
-            employees = self.data_layer.load_employees()
             report = self.analytics.generate_salary_report(employees)
             self.view.display_salary_report(report)
         except Exception as e:
@@ -543,43 +668,72 @@ class EmployeeApp:
             self.view.pause()
     
     def backup_data(self):
-        """Create a backup of employee data"""
+        """Create a backup of employee data without blocking the menu"""
         try:
             self.view.clear_screen()
             self.view.display_header()
             print("BACKUP DATA")
             print("-" * 15)
-            
-            if self.data_layer.backup_data():
-                self.view.display_success("Data backup created successfully!")
-                self.logger.info("Data backup created")
-            else:
-                self.view.display_error("Failed to create backup.")
-            
+
+            # One backup at a time; wait for any previous copy to finish
+            self._join_backup()
+
+            self._backup_thread = threading.Thread(
+                target=self._run_backup, name="backup", daemon=True
+            )
+            self._backup_thread.start()
+            self.view.display_success("Backup started in the background.")
+
         except Exception as e:
             self.view.display_error(f"Error creating backup: {e}")
-            self.logger.error(f"Error in backup_data: {e}")
+            self.logger.error("Error in backup_data: %s", e)
         finally:
             self.view.pause()
+
+    def _run_backup(self):
+        """Backup worker executed on the background thread"""
+        try:
+            if self.data_layer.backup_data():
+                self.logger.info("Data backup created")
+            else:
+                self.logger.error("Failed to create backup")
+        except Exception as e:
+            self.logger.error("Background backup failed: %s", e)
+
+    def _join_backup(self):
+        """Wait for an in-flight background backup to complete"""
+        if self._backup_thread is not None and self._backup_thread.is_alive():
+            self._backup_thread.join()
+        self._backup_thread = None
     
     def view_sql_operations(self):
         """Display SQL operations log"""
         try:
             self.view.clear_screen()
             self.view.display_header()
-            
-            self.view.display_sql_operations(self.sql_operations)
+
+            self.flush_sql_log()
+            rendered = [op._replace(sql=self._render_sql(op.sql, op.params))
+                        for op in self.sql_operations]
+            self.view.display_sql_operations(rendered)
             
         except Exception as e:
             self.view.display_error(f"Error displaying SQL operations: {e}")
-            self.logger.error(f"Error in view_sql_operations: {e}")
+            self.logger.error("Error in view_sql_operations: %s", e)
         finally:
             self.view.pause()
     
-    def __del__(self):
-        """Cleanup when application exits"""
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Deterministic cleanup: flush the SQL log and close the connection"""
+        self._join_backup()
+        self.flush_sql_log()
         if self.db_connection:
             self.db_connection.close()
+            self.db_connection = None
+        return False
 
 
 def main():
@@ -590,8 +744,8 @@ def main():
     print("=" * 60)
     
     try:
-        app = EmployeeApp()
-        app.run()
+        with EmployeeApp() as app:
+            app.run()
     except Exception as e:
         print(f"Fatal error: {e}")
         logging.error(f"Fatal error: {e}")
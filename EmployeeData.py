@@ -5,48 +5,357 @@ Handles CSV file operations for employee data persistence
 """
 
 import csv
+import io
+import mmap
 import os
+import shutil
 import logging
-from typing import List, Dict, Any, Optional
+from typing import Iterator, List, Dict, Any, Optional
 from employee import Employee, Manager
 
+# Optional bulk CSV parser; the stdlib csv module is used when absent
+try:
+    import pyarrow.csv as _pyarrow_csv
+except ImportError:
+    _pyarrow_csv = None
+
 # Configure logging for data operations
 data_logger = logging.getLogger('data_operations')
 data_logger.setLevel(logging.INFO)
 
+# 1 MiB I/O buffer for CSV reads/writes; the 8 KiB default makes row
+# I/O syscall-bound on larger files
+_IO_BUFFER = 1 << 20
+
+# Fixed CSV schema; matches Employee.to_row/from_row column order
+FIELDNAMES = ('id', 'fname', 'lname', 'department', 'ph_number', 'salary',
+              'employee_type', 'team_size', 'office_number')
+
+# Files below this size are cheaper to parse in-process than to ship to
+# worker processes
+_PARALLEL_THRESHOLD = 1 << 20
+
+
+def _row_converter(header):
+    """Pick a row-to-employee converter for this file's header.
+
+    Files written by this layer match FIELDNAMES and take the positional
+    fast path. Legacy files (e.g. the pre-salary 8-column layout) are
+    mapped through their own header names and from_dict, preserving the
+    old DictReader behavior of defaulting missing fields.
+    """
+    if header is None or tuple(header) == FIELDNAMES:
+        def convert(row):
+            if row[6] == 'Manager':
+                return Manager.from_row(row)
+            return Employee.from_row(row)
+    else:
+        names = list(header)
+
+        def convert(row):
+            data = dict(zip(names, row))
+            if data.get('employee_type') == 'Manager':
+                return Manager.from_dict(data)
+            return Employee.from_dict(data)
+    return convert
+
+
+def _parse_csv_segment(data: bytes) -> List[Employee]:
+    """Parse a headerless CSV byte segment into employee objects.
+
+    Module-level so ProcessPoolExecutor workers can pickle a reference
+    to it.
+    """
+    employees = []
+    reader = csv.reader(io.StringIO(data.decode('utf-8'), newline=''))
+    for row in reader:
+        if not row:
+            continue
+        try:
+            if row[6] == 'Manager':
+                employees.append(Manager.from_row(row))
+            else:
+                employees.append(Employee.from_row(row))
+        except Exception as e:
+            data_logger.error(f"Error loading employee from row {row}: {e}")
+    return employees
+
+class EmployeeTable:
+    """Column-oriented snapshot of an employee list (structure-of-arrays).
+
+    Scans walk compact parallel lists instead of chasing per-object
+    attribute lookups; the original row objects are kept so matches can
+    be handed back to the view without rebuilding them.
+    """
+
+    __slots__ = ('rows', 'ids', 'fnames_lc', 'lnames_lc', 'departments',
+                 'is_manager', 'team_sizes')
+
+    def __init__(self, rows: List[Employee]):
+        self.rows = rows
+        ids = self.ids = []
+        fnames = self.fnames_lc = []
+        lnames = self.lnames_lc = []
+        departments = self.departments = []
+        is_manager = self.is_manager = []
+        team_sizes = self.team_sizes = []
+        for emp in rows:
+            ids.append(emp.id)
+            fnames.append(emp._fname_lc)
+            lnames.append(emp._lname_lc)
+            departments.append(emp.department)
+            manager = emp._is_manager
+            is_manager.append(manager)
+            team_sizes.append(emp.team_size if manager else 0)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def search(self, criteria: Dict[str, Any]) -> List[Employee]:
+        """Columnar scan with normalized criteria and fail-fast predicates"""
+        id_query = criteria.get('id')
+        name_query = criteria.get('name', '').lower()
+        department = criteria.get('department')
+        type_query = criteria.get('type', '').lower()
+        want_manager = None
+        if type_query == 'manager':
+            want_manager = True
+        elif type_query == 'employee':
+            want_manager = False
+
+        rows = self.rows
+        is_manager = self.is_manager
+        departments = self.departments
+        fnames_lc = self.fnames_lc
+        lnames_lc = self.lnames_lc
+
+        matches = []
+        for i, emp_id in enumerate(self.ids):
+            if want_manager is not None and is_manager[i] is not want_manager:
+                continue
+            if department and departments[i] != department:
+                continue
+            if id_query and id_query not in emp_id:
+                continue
+            if name_query and (name_query not in fnames_lc[i]
+                               and name_query not in lnames_lc[i]):
+                continue
+            matches.append(rows[i])
+        return matches
+
+    def department_summary(self) -> Dict[str, Dict[str, Any]]:
+        """Single columnar pass accumulating per-department counts"""
+        dept_data: Dict[str, Dict[str, Any]] = {}
+        for dept, manager, team_size in zip(self.departments, self.is_manager,
+                                            self.team_sizes):
+            stats = dept_data.get(dept)
+            if stats is None:
+                stats = dept_data[dept] = {
+                    'count': 0,
+                    'managers': 0,
+                    'regular': 0,
+                    'total_team_size': 0
+                }
+            stats['count'] += 1
+            if manager:
+                stats['managers'] += 1
+                stats['total_team_size'] += team_size
+            else:
+                stats['regular'] += 1
+
+        for stats in dept_data.values():
+            managers = stats['managers']
+            stats['avg_team_size'] = stats['total_team_size'] / managers if managers else 0
+
+        return dept_data
+
+
 class EmployeeData:
     """Data access layer for employee operations"""
     
     def __init__(self, csv_file: str = "employee_data.csv"):
         """Initialize with CSV file path"""
         self.csv_file = csv_file
+        # Parsed-snapshot cache keyed by file mtime; repeat loads of an
+        # unchanged file skip the re-read and re-instantiation entirely
+        self._snapshot = None
+        self._snapshot_mtime_ns = -1
+        # id -> position in the snapshot, so ID lookups are O(1)
+        self._id_index = None
+        # department -> positions; built lazily by _department_index()
+        self._dept_index = None
+        # When deferring, mutations edit the cached snapshot only and a
+        # single flush() rewrites the file once at the end
+        self._defer_flush = False
+        self._dirty = False
         self.ensure_csv_exists()
+
+    def __enter__(self):
+        """Enter batch mode: mutations are coalesced into one rewrite"""
+        self._defer_flush = True
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Leave batch mode, flushing any pending mutations to disk"""
+        self._defer_flush = False
+        self.flush()
+        return False
+
+    def flush(self) -> bool:
+        """Write the cached snapshot to disk if mutations are pending"""
+        if not self._dirty:
+            return True
+        self._dirty = False
+        return self.save_employees(self._snapshot)
+
+    def _install_snapshot(self, employees: List[Employee], mtime_ns: int):
+        """Adopt a freshly parsed/written list as the cached snapshot"""
+        self._snapshot = employees
+        self._snapshot_mtime_ns = mtime_ns
+        self._id_index = {emp.id: i for i, emp in enumerate(employees)}
+        self._dept_index = None
+
+    def _department_index(self) -> Dict[str, List[int]]:
+        """department -> snapshot positions, built lazily on first use"""
+        if self._dept_index is None:
+            index: Dict[str, List[int]] = {}
+            for i, emp in enumerate(self._snapshot):
+                index.setdefault(emp.department, []).append(i)
+            self._dept_index = index
+        return self._dept_index
     
     def ensure_csv_exists(self):
         """Create CSV file with headers if it doesn't exist"""
         if not os.path.exists(self.csv_file):
-            with open(self.csv_file, 'w', newline='', encoding='utf-8') as file:
+            with open(self.csv_file, 'w', newline='', encoding='utf-8', buffering=_IO_BUFFER) as file:
                 writer = csv.writer(file)
-                writer.writerow(['id', 'fname', 'lname', 'department', 'ph_number', 'salary',
-                               'employee_type', 'team_size', 'office_number'])
+                writer.writerow(FIELDNAMES)
             data_logger.info(f"Created new CSV file: {self.csv_file}")
     
     def load_employees(self) -> List[Employee]:
-        """Load employees from CSV file"""
+        """Load employees from CSV file, reusing the snapshot if unchanged"""
+        try:
+            mtime_ns = os.stat(self.csv_file).st_mtime_ns
+        except OSError:
+            mtime_ns = -1
+
+        if self._snapshot is not None and mtime_ns == self._snapshot_mtime_ns:
+            return self._snapshot
+
+        employees = self._read_employees()
+        self._install_snapshot(employees, mtime_ns)
+        return employees
+
+    def load_employees_parallel(self, workers: Optional[int] = None) -> List[Employee]:
+        """Load a large CSV by parsing mmap'd segments in parallel.
+
+        The file is memory-mapped, split at newline boundaries into one
+        byte range per worker, and each range is parsed in a separate
+        process. Small files (or a fresh snapshot) fall back to the
+        regular loader. Assumes no embedded newlines inside quoted
+        fields, which this schema never produces.
+        """
+        try:
+            stat = os.stat(self.csv_file)
+        except OSError:
+            return []
+
+        if self._snapshot is not None and stat.st_mtime_ns == self._snapshot_mtime_ns:
+            return self._snapshot
+        if stat.st_size < _PARALLEL_THRESHOLD:
+            return self.load_employees()
+
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        try:
+            with open(self.csv_file, 'rb') as file, \
+                    mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                size = len(mm)
+                header_end = mm.find(b'\n') + 1
+
+                # Workers parse segments positionally, so a header that
+                # isn't the current schema goes to the header-aware loader
+                header = mm[:header_end].decode('utf-8').strip().split(',')
+                if tuple(header) != FIELDNAMES:
+                    return self.load_employees()
+
+                # Segment boundaries snapped forward to the next newline
+                bounds = [header_end]
+                for i in range(1, workers):
+                    guess = header_end + (size - header_end) * i // workers
+                    nl = mm.find(b'\n', guess)
+                    bounds.append(size if nl == -1 else nl + 1)
+                bounds.append(size)
+                bounds = sorted(set(bounds))
+                segments = [mm[a:b] for a, b in zip(bounds, bounds[1:]) if b > a]
+
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                parts = pool.map(_parse_csv_segment, segments)
+            employees = [emp for part in parts for emp in part]
+        except Exception as e:
+            data_logger.error(f"Parallel load failed, falling back: {e}")
+            return self.load_employees()
+
+        self._install_snapshot(employees, stat.st_mtime_ns)
+        data_logger.info(f"Loaded {len(employees)} employees in parallel")
+        return employees
+
+    def _read_employees_arrow(self) -> List[Employee]:
+        """Parse the CSV via pyarrow's vectorized reader.
+
+        The file is decoded column-at-a-time in C; rows are then
+        reassembled positionally and fed through the same from_row
+        converters as the stdlib path.
+        """
+        # Pin the text columns to string so all-digit values like phone
+        # numbers aren't inferred as integers
+        convert = _pyarrow_csv.ConvertOptions(column_types={
+            name: 'string' for name in FIELDNAMES
+            if name not in ('salary', 'team_size')})
+        table = _pyarrow_csv.read_csv(self.csv_file, convert_options=convert)
+        columns = [table[name].to_pylist() for name in FIELDNAMES]
+
+        employees = []
+        for row in zip(*columns):
+            try:
+                if row[6] == 'Manager':
+                    employees.append(Manager.from_row(row))
+                else:
+                    employees.append(Employee.from_row(row))
+            except Exception as e:
+                data_logger.error(f"Error loading employee from row {row}: {e}")
+
+        data_logger.info(f"Successfully loaded {len(employees)} employees")
+        return employees
+
+    def _read_employees(self) -> List[Employee]:
+        """Parse the CSV file into employee objects"""
+        if _pyarrow_csv is not None:
+            try:
+                return self._read_employees_arrow()
+            except Exception as e:
+                data_logger.error(f"pyarrow load failed, falling back: {e}")
+
         employees = []
-        
+
         try:
-            with open(self.csv_file, 'r', newline='', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                
+            with open(self.csv_file, 'r', newline='', encoding='utf-8', buffering=_IO_BUFFER) as file:
+                reader = csv.reader(file)
+                # Positional reader on the current schema: no per-row
+                # dict allocation or fieldname hashing like DictReader
+                # incurs. Legacy headers fall back to name mapping.
+                convert = _row_converter(next(reader, None))
+
                 for row in reader:
+                    if not row:
+                        continue
                     try:
-                        if row['employee_type'] == 'Manager':
-                            employee = Manager.from_dict(row)
-                        else:
-                            employee = Employee.from_dict(row)
+                        employee = convert(row)
                         employees.append(employee)
-                        data_logger.info(f"Loaded employee: {employee.id}")
+                        if data_logger.isEnabledFor(logging.DEBUG):
+                            data_logger.debug(f"Loaded employee: {employee.id}")
                     except Exception as e:
                         data_logger.error(f"Error loading employee from row {row}: {e}")
                         continue
@@ -61,113 +370,278 @@ class EmployeeData:
             data_logger.error(f"Error loading employees: {e}")
             return []
     
-    def save_employees(self, employees: List[Employee]) -> bool:
-        """Save employees to CSV file"""
+    def iter_employees(self, batch: int = 100) -> Iterator[List[Employee]]:
+        """Stream employees from the CSV in lists of at most `batch` rows.
+
+        Keeps peak memory at one batch and lets callers render the first
+        page before the rest of the file has been read.
+        """
         try:
-            with open(self.csv_file, 'w', newline='', encoding='utf-8') as file:
-                if not employees:
-                    # Write headers even if no data
-                    writer = csv.writer(file)
-                    writer.writerow(['id', 'fname', 'lname', 'department', 'ph_number', 'salary',
-                                   'employee_type', 'team_size', 'office_number'])
-                    return True
-                
-                fieldnames = ['id', 'fname', 'lname', 'department', 'ph_number', 'salary',
-                             'employee_type', 'team_size', 'office_number']
-                writer = csv.DictWriter(file, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for employee in employees:
-                    writer.writerow(employee.to_dict())
-                    data_logger.info(f"Saved employee: {employee.id}")
-            
+            with open(self.csv_file, 'r', newline='', encoding='utf-8', buffering=_IO_BUFFER) as file:
+                reader = csv.reader(file)
+                convert = _row_converter(next(reader, None))
+                chunk = []
+                for row in reader:
+                    if not row:
+                        continue
+                    try:
+                        employee = convert(row)
+                    except Exception as e:
+                        data_logger.error(f"Error loading employee from row {row}: {e}")
+                        continue
+                    chunk.append(employee)
+                    if len(chunk) >= batch:
+                        yield chunk
+                        chunk = []
+                if chunk:
+                    yield chunk
+        except FileNotFoundError:
+            data_logger.error(f"CSV file not found: {self.csv_file}")
+        except Exception as e:
+            data_logger.error(f"Error loading employees: {e}")
+
+    def save_employees(self, employees: List[Employee], durable: bool = False) -> bool:
+        """Save employees to CSV file.
+
+        The rows are written to a temp file which then replaces the real
+        one, so a crash mid-write never leaves a truncated CSV behind.
+        Pass durable=True to fsync before the rename.
+        """
+        tmp_file = self.csv_file + '.tmp'
+        try:
+            # Serialize every row up front so the write is one
+            # writerows call instead of N writerow round-trips
+            rows = [employee.to_row() for employee in employees]
+            with open(tmp_file, 'w', newline='', encoding='utf-8', buffering=_IO_BUFFER) as file:
+                writer = csv.writer(file)
+                writer.writerow(FIELDNAMES)
+                writer.writerows(rows)
+                if durable:
+                    file.flush()
+                    os.fsync(file.fileno())
+
+            # One rename syscall commits the new contents atomically
+            os.replace(tmp_file, self.csv_file)
+
+            # What we just wrote is the file's content; seed the snapshot
+            # so the next load skips the re-read
+            self._install_snapshot(list(employees),
+                                   os.stat(self.csv_file).st_mtime_ns)
+
             data_logger.info(f"Successfully saved {len(employees)} employees")
             return True
-            
+
         except Exception as e:
             data_logger.error(f"Error saving employees: {e}")
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
             return False
     
+    def _append_row(self, employee: Employee):
+        """Append a single row to the CSV without rewriting the file"""
+        with open(self.csv_file, 'a', newline='', encoding='utf-8', buffering=_IO_BUFFER) as file:
+            csv.writer(file).writerow(employee.to_row())
+
     def add_employee(self, employee: Employee) -> bool:
         """Add a single employee to the CSV file"""
         employees = self.load_employees()
-        
-        # Check if employee ID already exists
-        if any(emp.id == employee.id for emp in employees):
+
+        # O(1) duplicate check against the ID index
+        if employee.id in self._id_index:
             data_logger.warning(f"Employee ID {employee.id} already exists")
             return False
-        
+
+        # Inserts only ever grow the file, so append the one new row
+        # instead of rewriting all N of them
+        try:
+            self._append_row(employee)
+        except Exception as e:
+            data_logger.error(f"Error appending employee {employee.id}: {e}")
+            return False
+
+        # Patch the snapshot and indexes in place to match the file
+        self._id_index[employee.id] = len(employees)
+        if self._dept_index is not None:
+            self._dept_index.setdefault(employee.department, []).append(len(employees))
         employees.append(employee)
-        return self.save_employees(employees)
-    
+        self._snapshot_mtime_ns = os.stat(self.csv_file).st_mtime_ns
+        data_logger.info(f"Added employee: {employee.id}")
+        return True
+
+    def add_employees_bulk(self, employees: List[Employee]) -> int:
+        """Add a batch of employees in one append session.
+
+        Rows whose IDs already exist (or repeat within the batch) are
+        skipped with a warning. Returns the number of rows written.
+        """
+        current = self.load_employees()
+        index = self._id_index
+
+        new_employees = []
+        batch_ids = set()
+        for employee in employees:
+            if employee.id in index or employee.id in batch_ids:
+                data_logger.warning(f"Employee ID {employee.id} already exists")
+                continue
+            batch_ids.add(employee.id)
+            new_employees.append(employee)
+
+        if not new_employees:
+            return 0
+
+        try:
+            with open(self.csv_file, 'a', newline='', encoding='utf-8', buffering=_IO_BUFFER) as file:
+                csv.writer(file).writerows(
+                    employee.to_row() for employee in new_employees)
+        except Exception as e:
+            # The file may hold a partial batch; drop the snapshot so the
+            # next load re-reads what actually landed on disk
+            self._snapshot = None
+            self._snapshot_mtime_ns = -1
+            self._id_index = None
+            self._dept_index = None
+            data_logger.error(f"Error bulk-appending employees: {e}")
+            return 0
+
+        for employee in new_employees:
+            index[employee.id] = len(current)
+            current.append(employee)
+        self._dept_index = None
+        self._snapshot_mtime_ns = os.stat(self.csv_file).st_mtime_ns
+
+        data_logger.info(f"Added {len(new_employees)} employees in bulk")
+        return len(new_employees)
+
     def update_employee(self, employee_id: str, updated_employee: Employee) -> bool:
         """Update an existing employee"""
         employees = self.load_employees()
-        
-        for i, emp in enumerate(employees):
-            if emp.id == employee_id:
-                employees[i] = updated_employee
-                data_logger.info(f"Updated employee: {employee_id}")
-                return self.save_employees(employees)
-        
-        data_logger.warning(f"Employee ID {employee_id} not found for update")
-        return False
-    
+
+        i = self._id_index.get(employee_id)
+        if i is None:
+            data_logger.warning(f"Employee ID {employee_id} not found for update")
+            return False
+
+        data_logger.info(f"Updated employee: {employee_id}")
+        if self._defer_flush:
+            employees[i] = updated_employee
+            self._dept_index = None
+            self._dirty = True
+            return True
+
+        employees = list(employees)
+        employees[i] = updated_employee
+        return self.save_employees(employees)
+
     def delete_employee(self, employee_id: str) -> bool:
         """Delete an employee by ID"""
         employees = self.load_employees()
-        
-        original_count = len(employees)
-        employees = [emp for emp in employees if emp.id != employee_id]
-        
-        if len(employees) < original_count:
-            data_logger.info(f"Deleted employee: {employee_id}")
-            return self.save_employees(employees)
-        else:
+
+        i = self._id_index.get(employee_id)
+        if i is None:
             data_logger.warning(f"Employee ID {employee_id} not found for deletion")
             return False
-    
+
+        data_logger.info(f"Deleted employee: {employee_id}")
+        if self._defer_flush:
+            del employees[i]
+            # Positions after i shifted down; rebuild the index in memory
+            self._id_index = {emp.id: j for j, emp in enumerate(employees)}
+            self._dept_index = None
+            self._dirty = True
+            return True
+
+        employees = employees[:i] + employees[i + 1:]
+        return self.save_employees(employees)
+
     def find_employee(self, employee_id: str) -> Optional[Employee]:
         """Find an employee by ID"""
         employees = self.load_employees()
-        
-        for employee in employees:
-            if employee.id == employee_id:
-                return employee
-        
-        return None
+
+        i = self._id_index.get(employee_id)
+        return employees[i] if i is not None else None
     
+    def load_table(self, employees: Optional[List[Employee]] = None) -> EmployeeTable:
+        """Build a columnar EmployeeTable snapshot of the employee list"""
+        if employees is None:
+            employees = self.load_employees()
+        return EmployeeTable(employees)
+
+    def search(self, criteria: Dict[str, Any],
+               employees: Optional[List[Employee]] = None) -> List[Employee]:
+        """Filter employees in a single pass, like a parameterized WHERE clause.
+
+        Criteria are normalized once up front and each row fails fast on the
+        first non-matching predicate instead of evaluating every check.
+        """
+        table = self.load_table(employees)
+        matches = table.search(criteria)
+        data_logger.info(f"Search matched {len(matches)} of {len(table)} employees")
+        return matches
+
+    def department_summary(self,
+                           employees: Optional[List[Employee]] = None) -> Dict[str, Dict[str, Any]]:
+        """Aggregate per-department counts in a single pass.
+
+        Equivalent to a GROUP BY over department: one walk accumulates the
+        headcount, manager/regular split and team sizes, and the averages
+        are derived per department rather than in a second pass over rows.
+        """
+        return self.load_table(employees).department_summary()
+
     def get_employees_by_department(self, department: str) -> List[Employee]:
         """Get all employees in a specific department"""
         employees = self.load_employees()
-        return [emp for emp in employees if emp.department == department.upper()]
+        positions = self._department_index().get(department.upper(), ())
+        return [employees[i] for i in positions]
     
     def get_employee_count(self) -> int:
         """Get total number of employees"""
-        employees = self.load_employees()
-        return len(employees)
+        # A fresh snapshot answers this without touching the file
+        try:
+            mtime_ns = os.stat(self.csv_file).st_mtime_ns
+        except OSError:
+            return 0
+
+        if self._snapshot is not None and mtime_ns == self._snapshot_mtime_ns:
+            return len(self._snapshot)
+
+        # Otherwise count raw CSV rows; no per-row object construction
+        try:
+            with open(self.csv_file, 'r', newline='', encoding='utf-8', buffering=_IO_BUFFER) as file:
+                reader = csv.reader(file)
+                next(reader, None)  # skip header row
+                return sum(1 for row in reader if row)
+        except OSError as e:
+            data_logger.error(f"Error counting employees: {e}")
+            return 0
     
-    def backup_data(self, backup_file: str = None) -> bool:
-        """Create a backup of the current data"""
+    def backup_data(self, backup_file: str = None, validate: bool = False) -> bool:
+        """Create a backup of the current data.
+
+        By default the CSV is copied byte-for-byte, skipping the parse
+        and re-serialize round trip. Pass validate=True to re-serialize
+        through the employee objects instead, which drops any rows that
+        no longer pass validation.
+        """
         if backup_file is None:
             import datetime
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_file = f"employee_data_backup_{timestamp}.csv"
-        
+
         try:
-            employees = self.load_employees()
-            with open(backup_file, 'w', newline='', encoding='utf-8') as file:
-                fieldnames = ['id', 'fname', 'lname', 'department', 'ph_number', 'salary',
-                             'employee_type', 'team_size', 'office_number']
-                writer = csv.DictWriter(file, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for employee in employees:
-                    writer.writerow(employee.to_dict())
-            
+            if validate:
+                employees = self.load_employees()
+                rows = [employee.to_row() for employee in employees]
+                with open(backup_file, 'w', newline='', encoding='utf-8', buffering=_IO_BUFFER) as file:
+                    writer = csv.writer(file)
+                    writer.writerow(FIELDNAMES)
+                    writer.writerows(rows)
+            else:
+                shutil.copyfile(self.csv_file, backup_file)
+
             data_logger.info(f"Created backup: {backup_file}")
             return True
-            
+
         except Exception as e:
             data_logger.error(f"Error creating backup: {e}")
             return False
@@ -184,9 +658,8 @@ def test_data_operations():
     # Test data operations
     data_layer = EmployeeData("test_employees.csv")
     
-    # Test adding employees
-    print(f"Adding employee: {data_layer.add_employee(emp1)}")
-    print(f"Adding manager: {data_layer.add_employee(mgr1)}")
+    # Test adding employees (bulk path writes both rows in one session)
+    print(f"Adding employees in bulk: {data_layer.add_employees_bulk([emp1, mgr1])}")
     
     # Test loading employees
     employees = data_layer.load_employees()
@@ -5,20 +5,76 @@ Handles all user interface and display operations
 """
 
 import os
+import re
 import sys
 from typing import List, Optional, Dict, Any
-from employee import Employee, Manager
+from employee import Employee
+
+# Valid menu/prompt responses; frozensets give O(1) membership without
+# rebuilding a list literal per keystroke
+_MENU_CHOICES = frozenset({'1', '2', '3', '4', '5', '6', '7', '8', '9', '10'})
+_ANALYTICS_CHOICES = frozenset({'1', '2', '3', '4', '5', '6', '7', '8', '9'})
+_SEARCH_CHOICES = frozenset({'1', '2', '3', '4'})
+_YES = frozenset({'y', 'yes'})
+_NO = frozenset({'n', 'no'})
+
+# Compiled once; prevalidating input here gives immediate feedback
+# instead of bouncing bad values off the model's setters
+_ID_RE = re.compile(r'^[A-Z0-9]+$')
+_DEPT_RE = re.compile(r'^[A-Z]{2,3}$')
+_PHONE_RE = re.compile(r'^\D*(?:\d\D*){10}$')
+
+# Bound format method of the table-row template; the spec string is
+# parsed once instead of once per rendered row
+_ROW_FMT = "{id:<10} {name:<25} {dept:<12} {phone:<15} {salary:<12} {etype:<10}".format
+
+# (prompt, data key, convert, validator, invalid message, empty message)
+# for the required employee fields, consumed by get_employee_data
+_EMPLOYEE_FIELDS = (
+    ("Enter Employee ID: ", 'id', str.upper,
+     lambda v: _ID_RE.match(v) is not None,
+     "Employee ID must be letters and digits only.",
+     "Employee ID cannot be empty."),
+    ("Enter First Name: ", 'fname', None, None,
+     "Invalid first name.", "First name cannot be empty."),
+    ("Enter Last Name: ", 'lname', None, None,
+     "Invalid last name.", "Last name cannot be empty."),
+    ("Enter Department (3 letters, e.g., HR, IT, FIN): ", 'department',
+     str.upper, lambda v: _DEPT_RE.match(v) is not None,
+     "Department must be 2-3 letters.", "Department cannot be empty."),
+    ("Enter Phone Number (10 digits, any format): ", 'ph_number', None,
+     lambda v: _PHONE_RE.match(v) is not None,
+     "Phone number must contain exactly 10 digits.",
+     "Phone number cannot be empty."),
+    ("Enter Annual Salary: ", 'salary', float, lambda v: v >= 0,
+     "Please enter a valid non-negative number for salary.",
+     "Salary cannot be empty."),
+)
 
 class EmployeeView:
     """View class for handling all UI operations"""
     
     def __init__(self):
         """Initialize the view"""
+        # ANSI clearing only works on real terminals; dumb terminals and
+        # redirected output fall back to the shell clear command
+        self._ansi_screen = sys.stdout.isatty() and os.environ.get('TERM') != 'dumb'
+        if self._ansi_screen and os.name == 'nt':
+            # One-time no-op shell call flips the console into VT mode
+            # so the escape sequences below are interpreted
+            os.system('')
+        # Piped/scripted runs shouldn't block on "press Enter" prompts
+        self._interactive = sys.stdin.isatty() and sys.stdout.isatty()
         self.clear_screen()
-    
+
     def clear_screen(self):
         """Clear the console screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if self._ansi_screen:
+            # ANSI erase + cursor-home instead of spawning cls/clear
+            sys.stdout.write('\x1b[2J\x1b[H')
+            sys.stdout.flush()
+        else:
+            os.system('cls' if os.name == 'nt' else 'clear')
     
     def display_header(self):
         """Display application header"""
@@ -47,7 +103,7 @@ class EmployeeView:
         while True:
             try:
                 choice = input("Enter your choice (1-10): ").strip()
-                if choice in ['1', '2', '3', '4', '5', '6', '7', '8', '9', '10']:
+                if choice in _MENU_CHOICES:
                     return choice
                 else:
                     self.display_error("Invalid choice. Please enter 1-10.")
@@ -73,124 +129,91 @@ class EmployeeView:
                 return ""
     
     def get_employee_data(self, employee_type: str = "Employee") -> Dict[str, Any]:
-        """Get employee data from user input"""
+        """Get employee data from user input, driven by the field table"""
         data = {}
-        
-        # Get employee ID
-        while True:
-            try:
-                emp_id = input("Enter Employee ID: ").strip().upper()
-                if emp_id:
-                    data['id'] = emp_id
-                    break
-                else:
-                    self.display_error("Employee ID cannot be empty.")
-            except KeyboardInterrupt:
-                return {}
-            except EOFError:
-                return {}
-        
-        # Get first name
-        while True:
-            try:
-                fname = input("Enter First Name: ").strip()
-                if fname:
-                    data['fname'] = fname
-                    break
-                else:
-                    self.display_error("First name cannot be empty.")
-            except KeyboardInterrupt:
-                return {}
-            except EOFError:
-                return {}
-        
-        # Get last name
-        while True:
-            try:
-                lname = input("Enter Last Name: ").strip()
-                if lname:
-                    data['lname'] = lname
-                    break
-                else:
-                    self.display_error("Last name cannot be empty.")
-            except KeyboardInterrupt:
-                return {}
-            except EOFError:
-                return {}
-        
-        # Get department
-        while True:
-            try:
-                dept = input("Enter Department (3 letters, e.g., HR, IT, FIN): ").strip().upper()
-                if dept:
-                    data['department'] = dept
-                    break
-                else:
-                    self.display_error("Department cannot be empty.")
-            except KeyboardInterrupt:
-                return {}
-            except EOFError:
-                return {}
-        
-        # Get phone number
-        while True:
-            try:
-                phone = input("Enter Phone Number (10 digits, any format): ").strip()
-                if phone:
-                    data['ph_number'] = phone
-                    break
-                else:
-                    self.display_error("Phone number cannot be empty.")
-            except KeyboardInterrupt:
-                return {}
-            except EOFError:
-                return {}
-        
-        # Get salary
-        while True:
-            try:
-                salary_input = input("Enter Annual Salary: ").strip()
-                if salary_input:
-                    salary = float(salary_input)
-                    if salary >= 0:
-                        data['salary'] = salary
-                        break
-                    else:
-                        self.display_error("Salary cannot be negative.")
-                else:
-                    self.display_error("Salary cannot be empty.")
-            except ValueError:
-                self.display_error("Please enter a valid number for salary.")
-            except KeyboardInterrupt:
-                return {}
-            except EOFError:
+
+        for prompt, key, convert, validator, invalid_msg, empty_msg in _EMPLOYEE_FIELDS:
+            value = self._prompt_required(prompt, convert, validator,
+                                          invalid_msg, empty_msg)
+            if value is None:
                 return {}
-        
+            data[key] = value
+
         # Get manager-specific data
         if employee_type == "Manager":
-            while True:
-                try:
-                    team_size = input("Enter Team Size (0 or more): ").strip()
-                    if team_size.isdigit():
-                        data['team_size'] = int(team_size)
-                        break
-                    else:
-                        self.display_error("Team size must be a number.")
-                except KeyboardInterrupt:
-                    return {}
-                except EOFError:
-                    return {}
-            
+            team_size = self._prompt_required(
+                "Enter Team Size (0 or more): ", int, lambda v: v >= 0,
+                "Team size must be a number.", "Team size must be a number.")
+            if team_size is None:
+                return {}
+            data['team_size'] = team_size
+
             try:
                 office = input("Enter Office Number (optional): ").strip()
                 data['office_number'] = office
-            except KeyboardInterrupt:
-                return {}
-            except EOFError:
+            except (KeyboardInterrupt, EOFError):
                 return {}
-        
+
         return data
-    
+
+    def _prompt_required(self, prompt: str, convert=None, validator=None,
+                         invalid_msg: str = "Invalid value.",
+                         empty_msg: str = "Value cannot be empty."):
+        """Prompt until a valid value is entered; None means cancelled"""
+        while True:
+            try:
+                raw = input(prompt).strip()
+            except (KeyboardInterrupt, EOFError):
+                return None
+
+            if not raw:
+                self.display_error(empty_msg)
+                continue
+
+            try:
+                value = convert(raw) if convert else raw
+            except ValueError:
+                self.display_error(invalid_msg)
+                continue
+
+            if validator is None or validator(value):
+                return value
+            self.display_error(invalid_msg)
+
+    def collect_edits(self, employee: Employee) -> Dict[str, str]:
+        """Collect edited field values for an employee in one screenful.
+
+        The current values are written as a single block up front, then
+        one line is read per field; blank input keeps the current value.
+        Returns the raw strings so the controller can validate them.
+        """
+        parts = [
+            "\nCurrent values:\n",
+            f"  First Name: {employee.fname}\n",
+            f"  Last Name: {employee.lname}\n",
+            f"  Department: {employee.department}\n",
+            f"  Phone: {employee.get_formatted_phone()}\n",
+            f"  Salary: ${employee.salary:,.2f}\n",
+        ]
+        if employee.is_manager:
+            parts.append(f"  Team Size: {employee.team_size}\n")
+            parts.append(f"  Office: {employee.office_number}\n")
+        parts.append("\nEnter new information (press Enter to keep current value):\n")
+        sys.stdout.write(''.join(parts))
+        sys.stdout.flush()
+
+        edits = {
+            'fname': input("New First Name: ").strip(),
+            'lname': input("New Last Name: ").strip(),
+            'department': input("New Department: ").strip().upper(),
+            'phone': input("New Phone: ").strip(),
+            'salary': input("New Salary: ").strip(),
+        }
+        if employee.is_manager:
+            edits['team_size'] = input("New Team Size: ").strip()
+            edits['office_number'] = input("New Office: ").strip()
+        return edits
+
     def get_employee_type(self) -> str:
         """Get employee type from user"""
         while True:
@@ -211,29 +234,70 @@ class EmployeeView:
             except EOFError:
                 return "Employee"
     
-    def display_employees(self, employees: List[Employee], title: str = "EMPLOYEES"):
-        """Display list of employees"""
-        if not employees:
-            self.display_message("No employees found.")
-            return
-        
+    def _display_employee_header(self, title: str):
+        """Print the employee table title and column headings"""
         print(f"\n{title}:")
         print("-" * 100)
         print(f"{'ID':<10} {'Name':<25} {'Department':<12} {'Phone':<15} {'Salary':<12} {'Type':<10}")
         print("-" * 100)
-        
+
+    def _display_employee_rows(self, employees: List[Employee]):
+        """Write the table rows (plus manager detail lines) in one call.
+
+        Emitting one joined write instead of a print per row keeps large
+        listings from being dominated by per-line stdio overhead.
+        """
+        lines = []
         for emp in employees:
-            phone = emp.get_formatted_phone()
-            emp_type = "Manager" if isinstance(emp, Manager) else "Employee"
-            salary_str = f"${emp.salary:,.0f}"
-            print(f"{emp.id:<10} {emp.fname + ' ' + emp.lname:<25} {emp.department:<12} {phone:<15} {salary_str:<12} {emp_type:<10}")
-            
+            lines.append(_ROW_FMT(id=emp.id, name=emp.full_name,
+                                  dept=emp.department,
+                                  phone=emp.get_formatted_phone(),
+                                  salary=emp.salary_display_0,
+                                  etype=emp.TYPE))
+
             # Show additional manager info
-            if isinstance(emp, Manager):
-                print(f"{'':>10} Team Size: {emp.team_size}, Office: {emp.office_number}")
-        
+            if emp.is_manager:
+                lines.append(f"{'':>10} Team Size: {emp.team_size}, Office: {emp.office_number}")
+        lines.append('')
+        sys.stdout.write('\n'.join(lines))
+        sys.stdout.flush()
+
+    def display_employees(self, employees: List[Employee], title: str = "EMPLOYEES"):
+        """Display list of employees"""
+        if not employees:
+            self.display_message("No employees found.")
+            return
+
+        self._display_employee_header(title)
+        self._display_employee_rows(employees)
+
         print("-" * 100)
         print(f"Total: {len(employees)} employees")
+
+    def display_employee_pages(self, batches, title: str = "EMPLOYEES") -> int:
+        """Render batches of employees as they stream in, with a pager.
+
+        Returns the total number of employees shown. The first page is
+        printed as soon as the first batch arrives.
+        """
+        total = 0
+        for employees in batches:
+            if total == 0:
+                self._display_employee_header(title)
+            elif self._interactive:
+                # Piped runs stream every page; pausing would eat the
+                # next scripted line and then EOF out
+                input("-- More -- press Enter to continue --")
+            self._display_employee_rows(employees)
+            total += len(employees)
+
+        if total == 0:
+            self.display_message("No employees found.")
+            return 0
+
+        print("-" * 100)
+        print(f"Total: {total} employees")
+        return total
     
     def display_employee_details(self, employee: Employee):
         """Display detailed information about a single employee"""
@@ -247,10 +311,11 @@ class EmployeeView:
         print(f"Name: {employee.fname} {employee.lname}")
         print(f"Department: {employee.department}")
         print(f"Phone: {employee.get_formatted_phone()}")
-        print(f"Salary: ${employee.salary:,.2f}")
-        print(f"Type: {'Manager' if isinstance(employee, Manager) else 'Employee'}")
-        
-        if isinstance(employee, Manager):
+        print(f"Salary: {employee.salary_display}")
+        is_mgr = employee.is_manager
+        print(f"Type: {employee.TYPE}")
+
+        if is_mgr:
             print(f"Team Size: {employee.team_size}")
             print(f"Office: {employee.office_number}")
         
@@ -261,30 +326,38 @@ class EmployeeView:
         print(f"\nDEPARTMENT SUMMARY:")
         print("-" * 50)
         
+        lines = []
         for dept, info in department_data.items():
-            print(f"{dept}:")
-            print(f"  Employees: {info['count']}")
-            print(f"  Managers: {info['managers']}")
-            print(f"  Regular: {info['regular']}")
+            lines.append(f"{dept}:")
+            lines.append(f"  Employees: {info['count']}")
+            lines.append(f"  Managers: {info['managers']}")
+            lines.append(f"  Regular: {info['regular']}")
             if info['count'] > 0:
-                print(f"  Average Team Size: {info['avg_team_size']:.1f}")
-            print()
+                lines.append(f"  Average Team Size: {info['avg_team_size']:.1f}")
+            lines.append('')
+        lines.append('')
+        sys.stdout.write('\n'.join(lines))
+        sys.stdout.flush()
     
-    def display_sql_operations(self, operations: List[Dict[str, Any]]):
+    def display_sql_operations(self, operations: List[Any]):
         """Display SQL operations log"""
         if not operations:
             self.display_message("No SQL operations logged.")
             return
-        
+
         print(f"\nSQL OPERATIONS LOG:")
         print("-" * 60)
-        
+
+        lines = []
         for i, op in enumerate(operations, 1):
-            print(f"{i}. {op['timestamp']} - {op['operation']}")
-            print(f"   SQL: {op['sql']}")
-            if op.get('result'):
-                print(f"   Result: {op['result']}")
-            print()
+            lines.append(f"{i}. {op.timestamp} - {op.operation}")
+            lines.append(f"   SQL: {op.sql}")
+            if op.result:
+                lines.append(f"   Result: {op.result}")
+            lines.append('')
+        lines.append('')
+        sys.stdout.write('\n'.join(lines))
+        sys.stdout.flush()
     
     def display_salary_analytics_menu(self):
         """Display salary analytics menu"""
@@ -305,7 +378,7 @@ class EmployeeView:
         while True:
             try:
                 choice = input("Enter your choice (1-9): ").strip()
-                if choice in ['1', '2', '3', '4', '5', '6', '7', '8', '9']:
+                if choice in _ANALYTICS_CHOICES:
                     return choice
                 else:
                     self.display_error("Invalid choice. Please enter 1-9.")
@@ -314,6 +387,20 @@ class EmployeeView:
             except EOFError:
                 return '9'
     
+    def _write_stats_blocks(self, grouped_stats: Dict[str, Dict[str, Any]]):
+        """Write one labelled statistics block per group in a single call"""
+        lines = []
+        for label, stats in grouped_stats.items():
+            lines.append(f"{label}:")
+            lines.append(f"  Count: {stats['count']}")
+            lines.append(f"  Average: ${stats['average']:,.2f}")
+            lines.append(f"  Range: ${stats['min']:,.2f} - ${stats['max']:,.2f}")
+            lines.append(f"  Total: ${stats['total']:,.2f}")
+            lines.append('')
+        lines.append('')
+        sys.stdout.write('\n'.join(lines))
+        sys.stdout.flush()
+
     def display_salary_statistics(self, stats: Dict[str, Any]):
         """Display salary statistics"""
         print(f"\nSALARY STATISTICS:")
@@ -329,33 +416,23 @@ class EmployeeView:
         """Display department salary breakdown"""
         print(f"\nDEPARTMENT SALARY BREAKDOWN:")
         print("-" * 50)
-        for dept, stats in dept_stats.items():
-            print(f"{dept}:")
-            print(f"  Count: {stats['count']}")
-            print(f"  Average: ${stats['average']:,.2f}")
-            print(f"  Range: ${stats['min']:,.2f} - ${stats['max']:,.2f}")
-            print(f"  Total: ${stats['total']:,.2f}")
-            print()
+        self._write_stats_blocks(dept_stats)
     
     def display_employee_type_comparison(self, type_stats: Dict[str, Dict[str, Any]]):
         """Display employee type salary comparison"""
         print(f"\nEMPLOYEE TYPE SALARY COMPARISON:")
         print("-" * 50)
-        for emp_type, stats in type_stats.items():
-            print(f"{emp_type}:")
-            print(f"  Count: {stats['count']}")
-            print(f"  Average: ${stats['average']:,.2f}")
-            print(f"  Range: ${stats['min']:,.2f} - ${stats['max']:,.2f}")
-            print(f"  Total: ${stats['total']:,.2f}")
-            print()
+        self._write_stats_blocks(type_stats)
     
     def display_top_earners(self, employees: List[Employee], title: str):
         """Display top earners"""
         print(f"\n{title}:")
         print("-" * 60)
-        for i, emp in enumerate(employees, 1):
-            emp_type = "Manager" if isinstance(emp, Manager) else "Employee"
-            print(f"{i}. {emp.fname} {emp.lname} ({emp.department}) - ${emp.salary:,.2f} ({emp_type})")
+        lines = [f"{i}. {emp.full_name} ({emp.department}) - {emp.salary_display} ({emp.TYPE})"
+                 for i, emp in enumerate(employees, 1)]
+        lines.append('')
+        sys.stdout.write('\n'.join(lines))
+        sys.stdout.flush()
     
     def display_salary_gap_analysis(self, gap_analysis: Dict[str, Any]):
         """Display salary gap analysis"""
@@ -384,36 +461,40 @@ class EmployeeView:
         
         print(f"\nRECENT SALARY CHANGES:")
         print("-" * 60)
+        lines = []
         for change in changes:
-            print(f"{change['employee_name']} ({change['department']}):")
-            print(f"  ${change['old_salary']:,.2f} → ${change['new_salary']:,.2f}")
-            print(f"  Change: ${change['change_amount']:,.2f} ({change['change_percentage']:.1f}%)")
-            print(f"  Operation: {change['operation']} - {change['timestamp']}")
-            print()
+            lines.append(f"{change['employee_name']} ({change['department']}):")
+            lines.append(f"  ${change['old_salary']:,.2f} → ${change['new_salary']:,.2f}")
+            lines.append(f"  Change: ${change['change_amount']:,.2f} ({change['change_percentage']:.1f}%)")
+            lines.append(f"  Operation: {change['operation']} - {change['timestamp']}")
+            lines.append('')
+        lines.append('')
+        sys.stdout.write('\n'.join(lines))
+        sys.stdout.flush()
     
     def display_message(self, message: str):
         """Display a general message"""
         print(f"\n{message}")
-        input("Press Enter to continue...")
+        self.pause()
     
     def display_error(self, error_message: str):
         """Display an error message"""
         print(f"\nERROR: {error_message}")
-        input("Press Enter to continue...")
+        self.pause()
     
     def display_success(self, success_message: str):
         """Display a success message"""
         print(f"\nSUCCESS: {success_message}")
-        input("Press Enter to continue...")
+        self.pause()
     
     def confirm_action(self, message: str) -> bool:
         """Get user confirmation for an action"""
         while True:
             try:
                 response = input(f"{message} (y/n): ").strip().lower()
-                if response in ['y', 'yes']:
+                if response in _YES:
                     return True
-                elif response in ['n', 'no']:
+                elif response in _NO:
                     return False
                 else:
                     print("Please enter 'y' or 'n'.")
@@ -435,7 +516,7 @@ class EmployeeView:
         while True:
             try:
                 choice = input("Select search option (1-4): ").strip()
-                if choice in ['1', '2', '3', '4']:
+                if choice in _SEARCH_CHOICES:
                     break
                 else:
                     self.display_error("Invalid choice. Please enter 1-4.")
@@ -463,7 +544,7 @@ class EmployeeView:
         print("This system allows you to manage employee records")
         print("with full CRUD operations and data validation.")
         print()
-        input("Press Enter to continue...")
+        self.pause()
     
     def display_goodbye_message(self):
         """Display goodbye message"""
@@ -475,8 +556,9 @@ class EmployeeView:
         print("Goodbye!")
     
     def pause(self):
-        """Pause for user input"""
-        input("\nPress Enter to continue...")
+        """Pause for user input; a no-op when not attached to a terminal"""
+        if self._interactive:
+            input("\nPress Enter to continue...")
 
 
 def test_view():
@@ -4,24 +4,34 @@ Employee Management System - Model Layer
 Employee class with validation, inheritance, and polymorphism
 """
 
-import re
 import logging
+import sys
 from datetime import datetime
 from typing import Optional
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('employee_test.log'),
-        logging.StreamHandler()
-    ]
-)
+# Validation runs in every setter on every construction; plain string
+# machinery (set.isdisjoint, str.isalpha, filter) stays in C without
+# the regex engine's dispatch overhead
+_DIGITS = frozenset('0123456789')
+
+# Deletion table stripping every ASCII non-digit in one C pass; phone
+# input is ASCII, and anything exotic left over fails the length check
+_NON_DIGIT_TABLE = str.maketrans(
+    '', '', ''.join(chr(c) for c in range(128) if chr(c) not in _DIGITS))
 
 class Employee:
     """Base Employee class with validation and properties"""
-    
+
+    # Class-level type tag and flag; cheaper than isinstance in hot loops
+    TYPE = 'Employee'
+    _is_manager = False
+
+    # No per-instance __dict__: halves per-object memory on large loads
+    __slots__ = ('_id', '_fname', '_fname_lc', '_lname', '_lname_lc',
+                 '_full_name', '_department', '_ph_number',
+                 '_formatted_phone', '_salary', '_salary_display',
+                 '_salary_display_0')
+
     def __init__(self, emp_id: str, fname: str, lname: str, department: str, ph_number: str, salary: float = 0.0):
         """Initialize employee with validation"""
         self._id = emp_id
@@ -35,6 +45,11 @@ class Employee:
     def id(self) -> str:
         """Read-only employee ID"""
         return self._id
+
+    @property
+    def is_manager(self) -> bool:
+        """Whether this employee is a manager; avoids isinstance in hot loops"""
+        return self._is_manager
     
     @property
     def fname(self) -> str:
@@ -44,11 +59,15 @@ class Employee:
     @fname.setter
     def fname(self, value: str):
         """Set first name with validation"""
-        if not value or not isinstance(value, str):
+        # Exact-type check first; isinstance only for str subclasses
+        if not value or (value.__class__ is not str and not isinstance(value, str)):
             raise ValueError("First name cannot be empty")
-        if re.search(r'\d', value):
+        if not _DIGITS.isdisjoint(value):
             raise ValueError("First name cannot contain digits")
         self._fname = value.strip().title()
+        # Lowercased copy cached once so searches don't re-lower per row
+        self._fname_lc = self._fname.lower()
+        self._refresh_full_name()
     
     @property
     def lname(self) -> str:
@@ -58,12 +77,28 @@ class Employee:
     @lname.setter
     def lname(self, value: str):
         """Set last name with validation"""
-        if not value or not isinstance(value, str):
+        # Exact-type check first; isinstance only for str subclasses
+        if not value or (value.__class__ is not str and not isinstance(value, str)):
             raise ValueError("Last name cannot be empty")
-        if re.search(r'\d', value):
+        if not _DIGITS.isdisjoint(value):
             raise ValueError("Last name cannot contain digits")
         self._lname = value.strip().title()
-    
+        self._lname_lc = self._lname.lower()
+        self._refresh_full_name()
+    
+    def _refresh_full_name(self):
+        """Keep the cached display name in sync with either name field"""
+        try:
+            self._full_name = self._fname + ' ' + self._lname
+        except AttributeError:
+            # First name is set before last name during __init__
+            pass
+
+    @property
+    def full_name(self) -> str:
+        """Display name, precomputed so row rendering skips the concat"""
+        return self._full_name
+
     @property
     def department(self) -> str:
         """Department property with validation"""
@@ -72,11 +107,15 @@ class Employee:
     @department.setter
     def department(self, value: str):
         """Set department with validation"""
-        if not value or not isinstance(value, str):
+        # Exact-type check first; isinstance only for str subclasses
+        if not value or (value.__class__ is not str and not isinstance(value, str)):
             raise ValueError("Department cannot be empty")
-        if not re.match(r'^[A-Z]{2,3}$', value.upper()):
+        upper = value.upper()
+        if not (2 <= len(upper) <= 3 and upper.isalpha() and upper.isascii()):
             raise ValueError("Department must be 2-3 uppercase letters")
-        self._department = value.upper()
+        # Interned: only a handful of departments exist, so equality
+        # checks and dict keying degrade to pointer comparisons
+        self._department = sys.intern(upper)
     
     @property
     def ph_number(self) -> str:
@@ -86,16 +125,19 @@ class Employee:
     @ph_number.setter
     def ph_number(self, value: str):
         """Set phone number with sanitization"""
-        if not value or not isinstance(value, str):
+        # Exact-type check first; isinstance only for str subclasses
+        if not value or (value.__class__ is not str and not isinstance(value, str)):
             raise ValueError("Phone number cannot be empty")
         
         # Sanitize phone number - remove all non-digits
-        sanitized = re.sub(r'\D', '', value)
+        sanitized = value.translate(_NON_DIGIT_TABLE)
         
         if len(sanitized) != 10:
             raise ValueError("Phone number must be exactly 10 digits")
         
         self._ph_number = sanitized
+        # Display form precomputed once; redraws reuse it per row
+        self._formatted_phone = f"({sanitized[:3]})-{sanitized[3:6]}-{sanitized[6:]}"
     
     @property
     def salary(self) -> float:
@@ -105,20 +147,41 @@ class Employee:
     @salary.setter
     def salary(self, value: float):
         """Set salary with validation"""
-        if not isinstance(value, (int, float)):
+        cls = value.__class__
+        if cls is not int and cls is not float and not isinstance(value, (int, float)):
             raise ValueError("Salary must be a number")
         if value < 0:
             raise ValueError("Salary cannot be negative")
         self._salary = float(value)
+        # Both display forms rendered once per assignment, not per redraw
+        self._salary_display = f"${self._salary:,.2f}"
+        self._salary_display_0 = f"${self._salary:,.0f}"
     
+    @property
+    def salary_display(self) -> str:
+        """Salary formatted to cents for detail views"""
+        return self._salary_display
+
+    @property
+    def salary_display_0(self) -> str:
+        """Salary formatted to whole dollars for table rows"""
+        return self._salary_display_0
+
     def getphNumber(self) -> str:
         """Return unformatted 10-digit phone number"""
         return self._ph_number
     
     def get_formatted_phone(self) -> str:
         """Return formatted phone number for display"""
-        return f"({self._ph_number[:3]})-{self._ph_number[3:6]}-{self._ph_number[6:]}"
+        return self._formatted_phone
     
+    def __eq__(self, other) -> bool:
+        """Employees are identified by ID for set/dict membership"""
+        return isinstance(other, Employee) and self._id == other._id
+
+    def __hash__(self) -> int:
+        return hash(self._id)
+
     def __str__(self) -> str:
         """String representation of employee"""
         return (f"Employee ID: {self._id}, Name: {self._fname} {self._lname}, "
@@ -149,10 +212,36 @@ class Employee:
             salary=float(data.get('salary', 0))
         )
 
+    # Fixed CSV column order shared with the data layer:
+    # id, fname, lname, department, ph_number, salary,
+    # employee_type, team_size, office_number
+
+    def to_row(self) -> list:
+        """Convert employee to a positional CSV row"""
+        return [self._id, self._fname, self._lname, self._department,
+                self._ph_number, self._salary, 'Employee', '', '']
+
+    @classmethod
+    def from_row(cls, row: list):
+        """Create employee from a positional CSV row"""
+        return cls(
+            emp_id=row[0],
+            fname=row[1],
+            lname=row[2],
+            department=row[3],
+            ph_number=row[4],
+            salary=float(row[5] or 0)
+        )
+
 
 class Manager(Employee):
     """Manager subclass with additional attributes"""
-    
+
+    TYPE = 'Manager'
+    _is_manager = True
+
+    __slots__ = ('_team_size', '_office_number')
+
     def __init__(self, emp_id: str, fname: str, lname: str, department: str, 
                  ph_number: str, salary: float = 0.0, team_size: int = 0, office_number: str = ""):
         """Initialize manager with additional attributes"""
@@ -208,10 +297,30 @@ class Manager(Employee):
             department=data['department'],
             ph_number=data['ph_number'],
             salary=float(data.get('salary', 0)),
-            team_size=data.get('team_size', 0),
+            team_size=int(data.get('team_size') or 0),
             office_number=data.get('office_number', '')
         )
 
+    def to_row(self) -> list:
+        """Convert manager to a positional CSV row"""
+        return [self._id, self._fname, self._lname, self._department,
+                self._ph_number, self._salary, 'Manager',
+                self._team_size, self._office_number]
+
+    @classmethod
+    def from_row(cls, row: list):
+        """Create manager from a positional CSV row"""
+        return cls(
+            emp_id=row[0],
+            fname=row[1],
+            lname=row[2],
+            department=row[3],
+            ph_number=row[4],
+            salary=float(row[5] or 0),
+            team_size=int(row[7] or 0),
+            office_number=row[8]
+        )
+
 
 def test_employee_creation():
     """Test function to demonstrate employee creation and validation"""
@@ -278,4 +387,14 @@ def test_employee_creation():
 
 
 if __name__ == "__main__":
+    # Logging is configured here rather than at import time so importing
+    # the model never opens a log file as a side effect
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('employee_test.log'),
+            logging.StreamHandler()
+        ]
+    )
     test_employee_creation()
@@ -4,96 +4,411 @@ Simple MCP Server for SQLite Database Operations
 This server provides tools to interact with the employees.db database
 """
 
+import copy
 import json
+import queue
+import re
 import sqlite3
 import os
 import sys
+from collections import OrderedDict
+from contextlib import contextmanager
 from typing import Any, Dict, List, Optional
 
+# orjson parses and serializes several times faster than stdlib json and
+# returns bytes directly; fall back to a compact stdlib shim when absent
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+# Table references, used to key cached SELECT results and to find the
+# table a write statement touches
+_READ_TABLES_RE = re.compile(r'\b(?:FROM|JOIN)\s+([A-Za-z_]\w*)', re.IGNORECASE)
+_WRITE_TABLE_RE = re.compile(
+    r'\b(?:INSERT\s+(?:OR\s+\w+\s+)?INTO|UPDATE(?:\s+OR\s+\w+)?|DELETE\s+FROM)'
+    r'\s+([A-Za-z_]\w*)', re.IGNORECASE)
+
+# Upper bound on retained SELECT results
+MAX_CACHED_RESULTS = 128
+
+# Statement forms query_database will forward; anything else is
+# refused before SQLite has to parse it
+_READ_PREFIXES = ('SELECT', 'WITH', 'PRAGMA', 'EXPLAIN')
+
+# Rows fetched per driver round trip, and the largest result the
+# SELECT cache will keep a duplicate of
+FETCH_CHUNK = 1024
+MAX_CACHED_ROWS = 4096
+
+# Connections pre-opened per pool; WAL lets them read concurrently
+POOL_SIZE = 4
+
+
+class SQLitePool:
+    """Small pool of persistent SQLite connections.
+
+    Opening a connection repeats the handshake and schema load every
+    time, so the pool opens POOL_SIZE handles once and hands them out
+    for the life of the process.
+    """
+
+    def __init__(self, database_path: str, size: int = POOL_SIZE):
+        self._connections: "queue.Queue[sqlite3.Connection]" = queue.Queue(maxsize=size)
+        self._size = size
+        for _ in range(size):
+            self._connections.put(self._open(database_path))
+
+    @staticmethod
+    def _open(database_path: str) -> sqlite3.Connection:
+        # A deeper statement cache keeps repeated parameterized SQL
+        # from being re-parsed and re-planned on every call
+        connection = sqlite3.connect(database_path,
+                                     cached_statements=256,
+                                     check_same_thread=False)
+        # WAL groups commit fsyncs, NORMAL sync is safe under WAL,
+        # and the larger cache/mmap settings keep hot pages out of
+        # read syscalls entirely
+        connection.executescript(
+            "PRAGMA journal_mode=WAL;"
+            "PRAGMA synchronous=NORMAL;"
+            "PRAGMA cache_size=-65536;"
+            "PRAGMA mmap_size=268435456;"
+            "PRAGMA temp_store=MEMORY;"
+            "PRAGMA foreign_keys=ON;"
+        )
+        return connection
+
+    @contextmanager
+    def acquire(self):
+        """Check a connection out of the pool, blocking until one is free"""
+        connection = self._connections.get()
+        try:
+            yield connection
+        finally:
+            self._connections.put(connection)
+
+    def close_all(self):
+        """Close every pooled connection at shutdown"""
+        for _ in range(self._size):
+            self._connections.get().close()
+
+
 class SQLiteMCPServer:
     def __init__(self, database_path: str = "employees.db"):
         self.database_path = database_path
-        self.connection = None
+        self._pool: Optional[SQLitePool] = None
+        # Read-through cache of SELECT results keyed on (sql, params),
+        # invalidated per table by execute_write
+        self._result_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+        self._query_tables: Dict[tuple, frozenset] = {}
+        # Full schema dict, reused until PRAGMA schema_version moves
+        self._schema_cache: Optional[Dict[str, Any]] = None
+        self._schema_version = -1
         
     def connect(self):
-        """Connect to the SQLite database"""
+        """Open the connection pool for the SQLite database"""
         try:
-            self.connection = sqlite3.connect(self.database_path)
-            self.connection.row_factory = sqlite3.Row  # Enable column access by name
+            self._pool = SQLitePool(self.database_path)
             return True
         except sqlite3.Error as e:
             print(f"Error connecting to database: {e}", file=sys.stderr)
             return False
-    
+
     def disconnect(self):
-        """Disconnect from the database"""
-        if self.connection:
-            self.connection.close()
-            self.connection = None
+        """Close every pooled connection"""
+        if self._pool:
+            self._pool.close_all()
+            self._pool = None
     
     def execute_query(self, query: str, params: tuple = ()) -> Dict[str, Any]:
         """Execute a SELECT query and return results"""
-        if not self.connection:
+        if not self._pool:
             return {"error": "Not connected to database"}
-        
+
+        # Cheap prefix check saves a sqlite prepare on misuse and keeps
+        # writes from sneaking past the read-only tool
+        if not query.lstrip()[:7].upper().startswith(_READ_PREFIXES):
+            return {"error": "Only SELECT-style queries are allowed here"}
+
+        key = (query, params)
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            self._result_cache.move_to_end(key)
+            return copy.deepcopy(cached)
+
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(query, params)
-            rows = cursor.fetchall()
-            
-            # Convert rows to list of dictionaries
-            results = []
-            for row in rows:
-                results.append(dict(row))
-            
-            return {
+            with self._pool.acquire() as connection:
+                cursor = connection.cursor()
+                cursor.execute(query, params)
+                # Columnar shape: the column names go out once instead
+                # of being repeated as dict keys on every row, which
+                # shrinks both the response bytes and the serializer work
+                cols = [c[0] for c in cursor.description]
+                # Accumulate in driver-sized chunks rather than one
+                # fetchall; the driver reuses its chunk buffer, so the
+                # interpreter never holds result rows twice over
+                rows = []
+                while True:
+                    chunk = cursor.fetchmany(FETCH_CHUNK)
+                    if not chunk:
+                        break
+                    rows.extend(chunk)
+
+            result = {
                 "success": True,
-                "data": results,
-                "row_count": len(results)
+                "columns": cols,
+                "rows": rows,
+                "row_count": len(rows)
             }
+            # Caching keeps a deepcopy, doubling resident size; results
+            # past the cap are handed back uncached to stay at one copy
+            if len(rows) <= MAX_CACHED_ROWS:
+                self._cache_result(key, query, result)
+            return result
         except sqlite3.Error as e:
             return {"error": f"Database error: {e}"}
+
+    def _cache_result(self, key: tuple, query: str, result: Dict[str, Any]):
+        """Store a successful SELECT result, evicting the oldest entry"""
+        self._result_cache[key] = copy.deepcopy(result)
+        self._query_tables[key] = frozenset(
+            t.lower() for t in _READ_TABLES_RE.findall(query))
+        while len(self._result_cache) > MAX_CACHED_RESULTS:
+            oldest, _ = self._result_cache.popitem(last=False)
+            self._query_tables.pop(oldest, None)
+
+    def _invalidate_table(self, query: str):
+        """Drop cached results that depend on the table a write touched"""
+        match = _WRITE_TABLE_RE.search(query)
+        if match is None:
+            # Unrecognized statement shape; drop everything to be safe
+            self._result_cache.clear()
+            self._query_tables.clear()
+            return
+
+        table = match.group(1).lower()
+        stale = [key for key, tables in self._query_tables.items()
+                 if table in tables]
+        for key in stale:
+            del self._result_cache[key]
+            del self._query_tables[key]
     
     def execute_write(self, query: str, params: tuple = ()) -> Dict[str, Any]:
         """Execute INSERT, UPDATE, or DELETE queries"""
-        if not self.connection:
+        if not self._pool:
             return {"error": "Not connected to database"}
-        
+
+        with self._pool.acquire() as connection:
+            try:
+                cursor = connection.cursor()
+                cursor.execute(query, params)
+                connection.commit()
+                self._invalidate_table(query)
+
+                return {
+                    "success": True,
+                    "rows_affected": cursor.rowcount,
+                    "last_row_id": cursor.lastrowid
+                }
+            except sqlite3.Error as e:
+                connection.rollback()
+                return {"error": f"Database error: {e}"}
+
+    def execute_writemany(self, query: str, seq_of_params: List[Any]) -> Dict[str, Any]:
+        """Execute one write statement against many parameter rows
+
+        executemany prepares the statement once and commits once, so an
+        N-row insert costs a single parse and a single WAL fsync rather
+        than N of each.
+        """
+        if not self._pool:
+            return {"error": "Not connected to database"}
+
+        with self._pool.acquire() as connection:
+            try:
+                cursor = connection.cursor()
+                cursor.executemany(query, [tuple(p) for p in seq_of_params])
+                connection.commit()
+                self._invalidate_table(query)
+
+                return {
+                    "success": True,
+                    "rows_affected": cursor.rowcount
+                }
+            except sqlite3.Error as e:
+                connection.rollback()
+                return {"error": f"Database error: {e}"}
+
+    def execute_write_batch(self, statements: List[Any]) -> Dict[str, Any]:
+        """Execute a list of write statements inside one transaction
+
+        Every commit costs a WAL fsync, the slowest operation SQLite
+        performs; running the whole batch between one BEGIN IMMEDIATE
+        and one COMMIT pays that cost once instead of once per
+        statement.
+        """
+        if not self._pool:
+            return {"error": "Not connected to database"}
+
+        # Unpack the client-supplied shapes before BEGIN so malformed
+        # input fails while no transaction is open
         try:
-            cursor = self.connection.cursor()
-            cursor.execute(query, params)
-            self.connection.commit()
-            
-            return {
-                "success": True,
-                "rows_affected": cursor.rowcount,
-                "last_row_id": cursor.lastrowid
-            }
-        except sqlite3.Error as e:
-            self.connection.rollback()
-            return {"error": f"Database error: {e}"}
-    
+            pairs = [(statement[0],
+                      tuple(statement[1]) if len(statement) > 1 else ())
+                     for statement in statements]
+        except Exception as e:
+            return {"error": f"Invalid batch: {e}"}
+
+        with self._pool.acquire() as connection:
+            try:
+                cursor = connection.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+                rows_affected = 0
+                for query, params in pairs:
+                    cursor.execute(query, params)
+                    rows_affected += cursor.rowcount
+                connection.commit()
+                for query, _ in pairs:
+                    self._invalidate_table(query)
+
+                return {
+                    "success": True,
+                    "rows_affected": rows_affected,
+                    "statement_count": len(pairs)
+                }
+            except Exception as e:
+                # Any failure must roll back before the connection goes
+                # back to the pool, or the open write transaction wedges
+                # every sibling connection behind the lock
+                connection.rollback()
+                if isinstance(e, sqlite3.Error):
+                    return {"error": f"Database error: {e}"}
+                return {"error": f"Invalid batch: {e}"}
+
     def get_schema(self) -> Dict[str, Any]:
         """Get database schema information"""
-        if not self.connection:
+        if not self._pool:
             return {"error": "Not connected to database"}
-        
+
         try:
-            cursor = self.connection.cursor()
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
-            tables = cursor.fetchall()
-            
-            schema = {}
-            for table in tables:
-                table_name = table[0]
-                cursor.execute(f"PRAGMA table_info({table_name});")
-                columns = cursor.fetchall()
-                schema[table_name] = [dict(col) for col in columns]
-            
-            return {"success": True, "schema": schema}
+            with self._pool.acquire() as connection:
+                cursor = connection.cursor()
+                # schema_version is bumped by every DDL statement, so a
+                # matching value means the cached dict is still accurate
+                version = cursor.execute("PRAGMA schema_version").fetchone()[0]
+                if version == self._schema_version and self._schema_cache:
+                    return copy.deepcopy(self._schema_cache)
+
+                # One joined query against the pragma_table_info
+                # table-valued function replaces the old
+                # one-pragma-per-table loop: a single prepare and
+                # fetch regardless of table count
+                cursor.execute(
+                    "SELECT m.name, p.cid, p.name, p.type, p.\"notnull\","
+                    " p.dflt_value, p.pk"
+                    " FROM sqlite_master m JOIN pragma_table_info(m.name) p"
+                    " WHERE m.type='table'"
+                    " ORDER BY m.name, p.cid;"
+                )
+
+                schema: Dict[str, Any] = {}
+                for table_name, cid, name, col_type, notnull, dflt, pk in cursor.fetchall():
+                    schema.setdefault(table_name, []).append({
+                        "cid": cid,
+                        "name": name,
+                        "type": col_type,
+                        "notnull": notnull,
+                        "dflt_value": dflt,
+                        "pk": pk,
+                    })
+
+            result = {"success": True, "schema": schema}
+            self._schema_cache = copy.deepcopy(result)
+            self._schema_version = version
+            return result
         except sqlite3.Error as e:
             return {"error": f"Database error: {e}"}
 
+# The tools/list payload never changes; build and serialize it once
+_TOOLS_LIST_RESULT = {
+    "tools": [
+        {
+            "name": "query_database",
+            "description": "Execute a SELECT query on the database. "
+                           "Returns {columns: [...], rows: [[...], ...]} "
+                           "with the column names listed once",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": "SQL SELECT query to execute"
+                    },
+                    "params": {
+                        "type": "array",
+                        "description": "Query parameters",
+                        "items": {"type": "string"}
+                    }
+                },
+                "required": ["query"]
+            }
+        },
+        {
+            "name": "write_database",
+            "description": "Execute INSERT, UPDATE, or DELETE queries",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": "SQL query to execute"
+                    },
+                    "params": {
+                        "type": "array",
+                        "description": "Query parameters, or a list of "
+                                       "parameter rows to apply the query "
+                                       "to each row"
+                    }
+                },
+                "required": ["query"]
+            }
+        },
+        {
+            "name": "write_batch",
+            "description": "Execute a list of write statements in one transaction",
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "statements": {
+                        "type": "array",
+                        "description": "List of [query, params] pairs",
+                        "items": {"type": "array"}
+                    }
+                },
+                "required": ["statements"]
+            }
+        },
+        {
+            "name": "get_schema",
+            "description": "Get database schema information",
+            "inputSchema": {
+                "type": "object",
+                "properties": {}
+            }
+        }
+    ]
+}
+_TOOLS_LIST_BYTES = _dumps(_TOOLS_LIST_RESULT)
+
 def main():
     """Main function to run the MCP server"""
     # Get database path from environment or use default
@@ -107,15 +422,22 @@ def main():
         sys.exit(1)
     
     try:
-        # Read MCP messages from stdin
-        for line in sys.stdin:
+        # Read MCP messages from stdin as bytes; skips one str decode
+        # per line and feeds the parser directly. The bound readline
+        # avoids the iterator protocol; strip() keeps whitespace-only
+        # lines from reaching the parser as spurious error frames
+        readline = sys.stdin.buffer.readline
+        while True:
+            line = readline()
+            if not line:
+                break
             if not line.strip():
                 continue
-                
+
             try:
-                message = json.loads(line.strip())
+                message = _loads(line)
                 handle_message(server, message)
-            except json.JSONDecodeError as e:
+            except ValueError as e:
                 send_error(f"Invalid JSON: {e}")
             except Exception as e:
                 send_error(f"Unexpected error: {e}")
@@ -125,112 +447,88 @@ def main():
     finally:
         server.disconnect()
 
+# Response envelope fragments; serializing only the id and payload
+# skips building and dumping a fresh outer dict per reply
+_ENVELOPE_PREFIX = b'{"jsonrpc":"2.0","id":'
+_RESULT_INFIX = b',"result":'
+_ERROR_INFIX = b',"error":{"code":-1,"message":'
+
+def _handle_tools_list(server: SQLiteMCPServer, request_id, params: Dict[str, Any]):
+    """Answer tools/list from the precomputed payload"""
+    # Static response: splice the request id into precomputed bytes
+    sys.stdout.buffer.write(_ENVELOPE_PREFIX + _dumps(request_id)
+                            + _RESULT_INFIX + _TOOLS_LIST_BYTES + b'}\n')
+    sys.stdout.buffer.flush()
+
+def _handle_tools_call(server: SQLiteMCPServer, request_id, params: Dict[str, Any]):
+    """Route tools/call to the named tool handler"""
+    tool_name = params.get("name")
+    handler = TOOL_HANDLERS.get(tool_name)
+    if handler is None:
+        send_error(f"Unknown tool: {tool_name}", request_id)
+        return
+    send_response(request_id, handler(server, params.get("arguments", {})))
+
+def _tool_query_database(server: SQLiteMCPServer, arguments: Dict[str, Any]):
+    return server.execute_query(arguments.get("query"),
+                                tuple(arguments.get("params", [])))
+
+def _tool_write_database(server: SQLiteMCPServer, arguments: Dict[str, Any]):
+    query = arguments.get("query")
+    query_params = arguments.get("params", [])
+    # A list of lists means one statement applied to many rows;
+    # route through executemany so it prepares and commits once
+    if query_params and isinstance(query_params[0], list):
+        return server.execute_writemany(query, query_params)
+    return server.execute_write(query, tuple(query_params))
+
+def _tool_write_batch(server: SQLiteMCPServer, arguments: Dict[str, Any]):
+    return server.execute_write_batch(arguments.get("statements", []))
+
+def _tool_get_schema(server: SQLiteMCPServer, arguments: Dict[str, Any]):
+    return server.get_schema()
+
+# Dispatch tables built once at import; a dict probe per message
+# replaces the string-compare chain the old if/elif version walked
+METHOD_HANDLERS = {
+    "tools/list": _handle_tools_list,
+    "tools/call": _handle_tools_call,
+}
+TOOL_HANDLERS = {
+    "query_database": _tool_query_database,
+    "write_database": _tool_write_database,
+    "write_batch": _tool_write_batch,
+    "get_schema": _tool_get_schema,
+}
+
 def handle_message(server: SQLiteMCPServer, message: Dict[str, Any]):
     """Handle incoming MCP messages"""
     method = message.get("method")
-    params = message.get("params", {})
-    request_id = message.get("id")
-    
-    if method == "tools/list":
-        send_response(request_id, {
-            "tools": [
-                {
-                    "name": "query_database",
-                    "description": "Execute a SELECT query on the database",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": "SQL SELECT query to execute"
-                            },
-                            "params": {
-                                "type": "array",
-                                "description": "Query parameters",
-                                "items": {"type": "string"}
-                            }
-                        },
-                        "required": ["query"]
-                    }
-                },
-                {
-                    "name": "write_database",
-                    "description": "Execute INSERT, UPDATE, or DELETE queries",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "query": {
-                                "type": "string",
-                                "description": "SQL query to execute"
-                            },
-                            "params": {
-                                "type": "array",
-                                "description": "Query parameters",
-                                "items": {"type": "string"}
-                            }
-                        },
-                        "required": ["query"]
-                    }
-                },
-                {
-                    "name": "get_schema",
-                    "description": "Get database schema information",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {}
-                    }
-                }
-            ]
-        })
-    
-    elif method == "tools/call":
-        tool_name = params.get("name")
-        arguments = params.get("arguments", {})
-        
-        if tool_name == "query_database":
-            query = arguments.get("query")
-            query_params = tuple(arguments.get("params", []))
-            result = server.execute_query(query, query_params)
-            send_response(request_id, result)
-        
-        elif tool_name == "write_database":
-            query = arguments.get("query")
-            query_params = tuple(arguments.get("params", []))
-            result = server.execute_write(query, query_params)
-            send_response(request_id, result)
-        
-        elif tool_name == "get_schema":
-            result = server.get_schema()
-            send_response(request_id, result)
-        
-        else:
-            send_error(f"Unknown tool: {tool_name}", request_id)
-    
-    else:
-        send_error(f"Unknown method: {method}", request_id)
+    handler = METHOD_HANDLERS.get(method)
+    if handler is None:
+        send_error(f"Unknown method: {method}", message.get("id"))
+        return
+    handler(server, message.get("id"), message.get("params", {}))
 
 def send_response(request_id: Optional[str], result: Dict[str, Any]):
     """Send a response message"""
-    response = {
-        "jsonrpc": "2.0",
-        "id": request_id,
-        "result": result
-    }
-    print(json.dumps(response))
-    sys.stdout.flush()
+    buf = bytearray(_ENVELOPE_PREFIX)
+    buf += _dumps(request_id)
+    buf += _RESULT_INFIX
+    buf += _dumps(result)
+    buf += b'}\n'
+    sys.stdout.buffer.write(buf)
+    sys.stdout.buffer.flush()
 
 def send_error(message: str, request_id: Optional[str] = None):
     """Send an error message"""
-    error = {
-        "jsonrpc": "2.0",
-        "id": request_id,
-        "error": {
-            "code": -1,
-            "message": message
-        }
-    }
-    print(json.dumps(error))
-    sys.stdout.flush()
+    buf = bytearray(_ENVELOPE_PREFIX)
+    buf += _dumps(request_id)
+    buf += _ERROR_INFIX
+    buf += _dumps(message)
+    buf += b'}}\n'
+    sys.stdout.buffer.write(buf)
+    sys.stdout.buffer.flush()
 
 if __name__ == "__main__":
     main()
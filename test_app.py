@@ -6,8 +6,61 @@
 # - All employees are mutually exclusive in their roles (no overlap between types).
 # - For demonstration, at least one of each employee type will be created.
 
+import json
+import sys
+
 from AiDD_HW2 import Employee, Project, GeneralManager, ProjectManager, Programmer, Staff
 
+# orjson parses JSON lines faster when available; the stdlib parser is
+# a drop-in fallback
+try:
+	import orjson
+	_loads = orjson.loads
+except ImportError:
+	_loads = json.loads
+
+def _project_from_record(rec):
+	return Project(rec["projectname"], rec["revenue"])
+
+def _general_manager_from_record(rec):
+	projects = [_project_from_record(p) for p in rec.get("projects", [])]
+	return GeneralManager(rec["fname"], rec["lname"], rec["empid"],
+		rec["phone"], int(rec["year"]), projects)
+
+def _project_manager_from_record(rec):
+	return ProjectManager(rec["fname"], rec["lname"], rec["empid"],
+		rec["phone"], int(rec["year"]), _project_from_record(rec["project"]))
+
+def _programmer_from_record(rec):
+	return Programmer(rec["fname"], rec["lname"], rec["empid"],
+		rec["phone"], int(rec["year"]), rec["annualsalary"],
+		_project_from_record(rec["project"]))
+
+def _staff_from_record(rec):
+	return Staff(rec["fname"], rec["lname"], rec["empid"],
+		rec["phone"], int(rec["year"]), rec["annualsalary"])
+
+_RECORD_BUILDERS = {
+	"general_manager": _general_manager_from_record,
+	"project_manager": _project_manager_from_record,
+	"programmer": _programmer_from_record,
+	"staff": _staff_from_record,
+}
+
+def load_employees_bulk():
+	# One JSON line per employee, e.g.
+	# {"type": "staff", "fname": "A", "lname": "B", "empid": "1",
+	#  "phone": "555", "year": 2020, "annualsalary": 40000}
+	# Reading whole records skips the per-attribute input() round trips
+	# when the script is driven from automation.
+	employees = []
+	for line in sys.stdin.buffer:
+		if not line.strip():
+			continue
+		rec = _loads(line)
+		employees.append(_RECORD_BUILDERS[rec["type"]](rec))
+	return employees
+
 def prompt_project():
 	name = input("Enter project name: ")
 	revenue = float(input("Enter project revenue: "))
@@ -62,13 +115,17 @@ def create_staff():
 	return Staff(fname, lname, empid, phone, year, annualsalary)
 
 def main():
-	employees = []
 	print("Welcome to the KSD Personnel Management System Prototype!\n")
-	# For demonstration, create at least one of each type
-	employees.append(create_general_manager())
-	employees.append(create_project_manager())
-	employees.append(create_programmer())
-	employees.append(create_staff())
+	if not sys.stdin.isatty():
+		# Piped input: read JSON records in bulk instead of prompting
+		employees = load_employees_bulk()
+	else:
+		employees = []
+		# For demonstration, create at least one of each type
+		employees.append(create_general_manager())
+		employees.append(create_project_manager())
+		employees.append(create_programmer())
+		employees.append(create_staff())
 
 	print("\nAll Employees and Their Compensation:")
 	for emp in employees: